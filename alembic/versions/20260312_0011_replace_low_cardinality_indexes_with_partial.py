@@ -0,0 +1,55 @@
+"""replace low-cardinality indexes with partial indexes
+
+Revision ID: 20260312_0011
+Revises: 20260309_0010
+Create Date: 2026-03-12 00:00:00
+
+``datasets.source_type`` only ever holds csv/excel/api/manual and
+``clients.is_active`` is almost always true, so full B-tree indexes on
+those columns are rarely chosen by the planner yet still cost a write on
+every insert/update.  They are replaced with partial indexes covering
+only the selective minority values.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260312_0011"
+down_revision = "20260309_0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_datasets_source_type", table_name="datasets")
+    op.create_index(
+        "ix_datasets_client_source_api",
+        "datasets",
+        ["client_id"],
+        postgresql_where=sa.text("source_type = 'api'"),
+    )
+    op.create_index(
+        "ix_datasets_client_source_manual",
+        "datasets",
+        ["client_id"],
+        postgresql_where=sa.text("source_type = 'manual'"),
+    )
+
+    op.drop_index("ix_clients_is_active", table_name="clients")
+    op.create_index(
+        "ix_clients_inactive",
+        "clients",
+        ["id"],
+        postgresql_where=sa.text("NOT is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clients_inactive", table_name="clients")
+    op.create_index("ix_clients_is_active", "clients", ["is_active"])
+
+    op.drop_index("ix_datasets_client_source_manual", table_name="datasets")
+    op.drop_index("ix_datasets_client_source_api", table_name="datasets")
+    op.create_index("ix_datasets_source_type", "datasets", ["source_type"])
@@ -0,0 +1,64 @@
+"""use BRIN indexes for time-ordered timestamp columns
+
+Revision ID: 20260314_0012
+Revises: 20260312_0011
+Create Date: 2026-03-14 00:00:00
+
+``forecast_metric.period_end``, ``business_risk_scores.period_end`` and
+``datasets.processed_at`` are written in roughly increasing order and are
+only ever range-filtered (BI export date windows), never looked up by exact
+value.  BRIN indexes store per-block min/max summaries, so they prune the
+same range scans while staying orders of magnitude smaller than B-trees.
+
+``created_at`` indexes on ingestion_jobs / scoring_runs stay B-tree: list
+endpoints sort on them with LIMIT, which BRIN cannot serve.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260314_0012"
+down_revision = "20260312_0011"
+branch_labels = None
+depends_on = None
+
+_BRIN_INDEXES: tuple[tuple[str, str, str, str], ...] = (
+    # (btree index, brin index, table, column)
+    (
+        "ix_forecast_metric_period_end",
+        "ix_forecast_metric_period_end_brin",
+        "forecast_metric",
+        "period_end",
+    ),
+    (
+        "ix_business_risk_scores_period_end",
+        "ix_business_risk_scores_period_end_brin",
+        "business_risk_scores",
+        "period_end",
+    ),
+    (
+        "ix_datasets_processed_at",
+        "ix_datasets_processed_at_brin",
+        "datasets",
+        "processed_at",
+    ),
+)
+
+
+def upgrade() -> None:
+    for btree_name, brin_name, table, column in _BRIN_INDEXES:
+        op.drop_index(btree_name, table_name=table)
+        op.create_index(
+            brin_name,
+            table,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        )
+
+
+def downgrade() -> None:
+    for btree_name, brin_name, table, column in reversed(_BRIN_INDEXES):
+        op.drop_index(brin_name, table_name=table)
+        op.create_index(btree_name, table, [column])
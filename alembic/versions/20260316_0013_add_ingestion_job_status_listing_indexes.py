@@ -0,0 +1,79 @@
+"""add composite and partial indexes for ingestion status listing
+
+Revision ID: 20260316_0013
+Revises: 20260314_0012
+Create Date: 2026-03-16 00:00:00
+
+``GET /ingestion-status`` filters by ``job_type`` / ``status`` and pages by
+``(created_at, id) DESC``.  A composite index in that column order lets
+PostgreSQL walk rows in output order and stop at LIMIT.  A partial index
+over pending/running/failed jobs serves the "what is stuck or broken"
+queries without touching the completed rows that dominate the table.
+
+The new composite index leads with ``job_type`` (and ``job_type, status``),
+so the old single-column and two-column indexes are dropped as redundant.
+Indexes are built CONCURRENTLY to avoid locking out job writers.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20260316_0013"
+down_revision = "20260314_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ingestion_jobs_type_status_created",
+            "ingestion_jobs",
+            ["job_type", "status", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_ingestion_jobs_active_type_created",
+            "ingestion_jobs",
+            ["job_type", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_where=sa.text("status IN ('pending', 'running', 'failed')"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_ingestion_jobs_job_type_status",
+            table_name="ingestion_jobs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_ingestion_jobs_job_type",
+            table_name="ingestion_jobs",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ingestion_jobs_job_type",
+            "ingestion_jobs",
+            ["job_type"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_ingestion_jobs_job_type_status",
+            "ingestion_jobs",
+            ["job_type", "status"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_ingestion_jobs_active_type_created",
+            table_name="ingestion_jobs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_ingestion_jobs_type_status_created",
+            table_name="ingestion_jobs",
+            postgresql_concurrently=True,
+        )
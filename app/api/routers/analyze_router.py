@@ -47,7 +47,7 @@ from app.services.kpi_canonical_schema import (
     infer_analytics_strategy_from_categories,
 )
 from app.services.dataset_hash import compute_dataset_hash
-from app.services.kpi_orchestrator import ANALYTICS_VERSION, KPIOrchestrator, KPIRunResult
+from app.services.kpi_orchestrator import ANALYTICS_VERSION, KPIRunResult, get_kpi_orchestrator
 from db.models.canonical_insight_record import CanonicalInsightRecord
 from db.repositories.kpi_repository import KPIRepository
 from db.session import get_db
@@ -164,7 +164,7 @@ def _ensure_analytics_data(
 
     # --- Monthly KPI computation ---
     monthly_windows = _generate_monthly_windows(data_start, data_end)
-    orchestrator = KPIOrchestrator()
+    orchestrator = get_kpi_orchestrator()
     all_results: list[KPIRunResult] = []
 
     for win_start, win_end in monthly_windows:
@@ -27,12 +27,12 @@ HTTP plumbing (serialisation, content-type, error mapping).
 
 from __future__ import annotations
 
-import csv
 import io
 import json
 import logging
+import re
 from datetime import date
-from typing import Any
+from typing import Any, Callable, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
@@ -61,8 +61,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["export"])
 
-_VALID_DATASETS = frozenset({"records", "kpis", "forecasts", "risk"})
-_VALID_FORMATS = frozenset({"csv", "json"})
+ExportDataset = Literal["records", "kpis", "forecasts", "risk"]
+ExportFormat = Literal["csv", "json"]
+
+# Characters that force a CSV cell to be quoted; most BI cells (names,
+# ISO dates, numbers) contain none and are emitted verbatim.
+_CSV_NEEDS_QUOTE = re.compile(r'[",\r\n]')
 
 
 # ---------------------------------------------------------------------------
@@ -70,28 +74,31 @@ _VALID_FORMATS = frozenset({"csv", "json"})
 # ---------------------------------------------------------------------------
 
 
-def _to_csv_streaming(result: ExportResult, filename: str) -> StreamingResponse:
+def _csv_cell(value: Any) -> str:
+    """Render one CSV cell; only cells containing delimiter/quote/newline are quoted."""
+    # Normalise None → "" for PowerBI compatibility
+    text = "" if value is None else str(value)
+    if _CSV_NEEDS_QUOTE.search(text) is None:
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _csv_line(cells: list[Any]) -> str:
+    """Join cells into one CRLF-terminated line, matching ``csv`` QUOTE_MINIMAL output."""
+    if len(cells) == 1 and (cells[0] is None or cells[0] == ""):
+        return '""\r\n'
+    return ",".join(_csv_cell(cell) for cell in cells) + "\r\n"
+
+
+def _to_csv_streaming(result: ExportResult, dataset: str) -> StreamingResponse:
     """Stream *result* as a UTF-8 CSV file download."""
+    filename = f"{dataset}_export.csv"
+    fields = list(result.fields)
 
     def _generate() -> io.Iterator[str]:
-        buf = io.StringIO()
-        writer = csv.DictWriter(
-            buf,
-            fieldnames=result.fields,
-            extrasaction="ignore",
-            restval="",
-            lineterminator="\r\n",
-        )
-        writer.writeheader()
-        yield buf.getvalue()
-
+        yield _csv_line(fields)
         for row in result.rows:
-            buf.seek(0)
-            buf.truncate(0)
-            # Normalise None → "" for PowerBI compatibility
-            clean = {k: ("" if v is None else v) for k, v in row.items()}
-            writer.writerow(clean)
-            yield buf.getvalue()
+            yield _csv_line([row.get(field) for field in fields])
 
     return StreamingResponse(
         content=_generate(),
@@ -115,6 +122,12 @@ def _to_json_response(result: ExportResult, dataset: str) -> JSONResponse:
     )
 
 
+_SERIALISERS: dict[str, Callable[[ExportResult, str], StreamingResponse | JSONResponse]] = {
+    "csv": _to_csv_streaming,
+    "json": _to_json_response,
+}
+
+
 # ---------------------------------------------------------------------------
 # Endpoint
 # ---------------------------------------------------------------------------
@@ -123,11 +136,11 @@ def _to_json_response(result: ExportResult, dataset: str) -> JSONResponse:
 @router.get("/export/bi", summary="Export analytics data for BI tools", response_model=None)
 @router.get("/export/powerbi", summary="Export analytics data for BI tools", response_model=None)
 def export_bi(
-    dataset: str = Query(
+    dataset: ExportDataset = Query(
         default="records",
         description='Dataset to export: "records", "kpis", "forecasts", or "risk".',
     ),
-    output_format: str = Query(
+    output_format: ExportFormat = Query(
         default="csv",
         alias="format",
         description='Output format: "csv" (file download) or "json".',
@@ -161,27 +174,12 @@ def export_bi(
     Use the ``dataset`` parameter to choose the data source and ``format``
     to choose the output encoding.  Apply ``entity_name``, ``date_from``,
     and ``date_to`` to narrow the result set before the row ``limit`` is
-    applied.
+    applied.  Unknown ``dataset`` / ``format`` values are rejected by the
+    query-parameter schema before the handler runs.
     """
     # --- Validate query params ---
     if entity_name:
         assert_entity_allowed_for_tenant(entity_name=entity_name, security=security)
-    if dataset not in _VALID_DATASETS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=build_error_detail(
-                code=SCHEMA_CONFLICT,
-                message=f"Invalid dataset {dataset!r}. Must be one of: {sorted(_VALID_DATASETS)}.",
-            ),
-        )
-    if output_format not in _VALID_FORMATS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=build_error_detail(
-                code=SCHEMA_CONFLICT,
-                message=f"Invalid format {output_format!r}. Must be one of: {sorted(_VALID_FORMATS)}.",
-            ),
-        )
     if date_from and date_to and date_from > date_to:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -228,10 +226,7 @@ def export_bi(
     )
 
     # --- Serialise ---
-    filename = f"{dataset}_export.csv"
-    if output_format == "csv":
-        return _to_csv_streaming(result, filename)
-    return _to_json_response(result, dataset)
+    return _SERIALISERS[output_format](result, dataset)
 
 
 @router.get("/export/report", summary="Export formatted insight report", response_model=None)
@@ -7,6 +7,7 @@ Competitor scraping ingestion endpoints.
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.failure_codes import EXTERNAL_UNAVAILABLE, SCHEMA_CONFLICT, build_error_detail
@@ -19,6 +20,8 @@ from db.session import get_db
 
 router = APIRouter(tags=["competitor-scraping"])
 
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[CompetitorScrapeSummaryResponse])
+
 
 @router.post("/ingest-competitors", response_model=list[CompetitorScrapeSummaryResponse])
 def ingest_competitors(
@@ -49,14 +52,4 @@ def ingest_competitors(
             ),
         ) from exc
 
-    return [
-        CompetitorScrapeSummaryResponse(
-            competitor=summary.competitor,
-            records_scraped=summary.records_scraped,
-            records_inserted=summary.records_inserted,
-            failed_pages=summary.failed_pages,
-            status=summary.status,
-            errors=summary.errors,
-        )
-        for summary in summaries
-    ]
+    return _SUMMARY_LIST_ADAPTER.validate_python(summaries)
@@ -7,6 +7,7 @@ External data ingestion HTTP endpoints.
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.failure_codes import EXTERNAL_UNAVAILABLE, SCHEMA_CONFLICT, build_error_detail
@@ -19,6 +20,8 @@ from db.session import get_db
 
 router = APIRouter(tags=["external-ingestion"])
 
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ExternalIngestionSummaryResponse])
+
 
 @router.post("/ingest-external", response_model=list[ExternalIngestionSummaryResponse])
 def ingest_external(
@@ -49,11 +52,4 @@ def ingest_external(
             ),
         ) from exc
 
-    return [
-        ExternalIngestionSummaryResponse(
-            source=summary.source,
-            records_inserted=summary.records_inserted,
-            failed_records=summary.failed_records,
-        )
-        for summary in summaries
-    ]
+    return _SUMMARY_LIST_ADAPTER.validate_python(summaries)
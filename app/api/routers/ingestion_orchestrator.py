@@ -1,12 +1,37 @@
 """
 Async ingestion orchestration endpoints.
+
+Job submission and status lookups are short DB round-trips, so they run as
+``async def`` handlers on an ``AsyncSession``.  CSV submission stays a sync
+handler: spooling the upload to a temp file is blocking file IO and belongs
+in the threadpool.
+
+Listing ``/ingestion-status`` is revalidated with a weak ETag built from
+``max(updated_at)`` and ``count(*)`` over the filtered rows: an aggregate on
+the job indexes decides whether the full page needs to be fetched at all.
+
+Submit endpoints scope their session to the handler (``scope="function"``):
+it only inserts the job row, and is closed before the 202 goes out rather
+than lingering until the background job finishes.  Jobs open their own.
 """
 
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_csv_upload
@@ -14,6 +39,7 @@ from app.failure_codes import SCHEMA_CONFLICT, build_error_detail
 from app.schemas.ingestion_orchestrator import (
     IngestionJobAcceptedResponse,
     IngestionJobStatusResponse,
+    IngestionStatusCursor,
     IngestionStatusListResponse,
 )
 from app.services.ingestion_orchestrator_service import (
@@ -22,6 +48,7 @@ from app.services.ingestion_orchestrator_service import (
     get_ingestion_orchestrator_service,
 )
 from db.models.ingestion_job import IngestionJob
+from db.async_session import get_async_db
 from db.session import get_db
 
 router = APIRouter(tags=["ingestion-orchestrator"])
@@ -37,7 +64,7 @@ def trigger_csv_ingestion(
     file: UploadFile = Depends(get_csv_upload),
     client_name: str | None = Query(default=None, description="Optional client name to scope mapping config"),
     mapping_config_name: str | None = Query(default=None, description="Optional explicit mapping config name"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     orchestrator: IngestionOrchestratorService = Depends(get_ingestion_orchestrator_service),
 ) -> IngestionJobAcceptedResponse:
     try:
@@ -51,12 +78,7 @@ def trigger_csv_ingestion(
     finally:
         file.file.close()
 
-    return IngestionJobAcceptedResponse(
-        job_id=job.id,
-        job_type=job.job_type,
-        status=job.status,
-        created_at=job.created_at,
-    )
+    return IngestionJobAcceptedResponse.model_validate(job)
 
 
 @router.post(
@@ -64,23 +86,18 @@ def trigger_csv_ingestion(
     status_code=status.HTTP_202_ACCEPTED,
     response_model=IngestionJobAcceptedResponse,
 )
-def trigger_api_ingestion(
+async def trigger_api_ingestion(
     background_tasks: BackgroundTasks,
     source: str | None = Query(default=None, description="Optional external source filter"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
     orchestrator: IngestionOrchestratorService = Depends(get_ingestion_orchestrator_service),
 ) -> IngestionJobAcceptedResponse:
-    job = orchestrator.trigger_api_ingestion(
+    job = await orchestrator.trigger_api_ingestion_async(
         db=db,
         executor=FastAPIBackgroundTaskExecutor(background_tasks),
         source=source,
     )
-    return IngestionJobAcceptedResponse(
-        job_id=job.id,
-        job_type=job.job_type,
-        status=job.status,
-        created_at=job.created_at,
-    )
+    return IngestionJobAcceptedResponse.model_validate(job)
 
 
 @router.post(
@@ -88,36 +105,45 @@ def trigger_api_ingestion(
     status_code=status.HTTP_202_ACCEPTED,
     response_model=IngestionJobAcceptedResponse,
 )
-def trigger_competitor_scraping(
+async def trigger_competitor_scraping(
     background_tasks: BackgroundTasks,
     competitor: str | None = Query(default=None, description="Optional competitor name filter"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
     orchestrator: IngestionOrchestratorService = Depends(get_ingestion_orchestrator_service),
 ) -> IngestionJobAcceptedResponse:
-    job = orchestrator.trigger_competitor_scraping(
+    job = await orchestrator.trigger_competitor_scraping_async(
         db=db,
         executor=FastAPIBackgroundTaskExecutor(background_tasks),
         competitor=competitor,
     )
-    return IngestionJobAcceptedResponse(
-        job_id=job.id,
-        job_type=job.job_type,
-        status=job.status,
-        created_at=job.created_at,
-    )
+    return IngestionJobAcceptedResponse.model_validate(job)
 
 
 @router.get("/ingestion-status", response_model=IngestionStatusListResponse)
-def get_ingestion_status(
+async def get_ingestion_status(
+    request: Request,
+    response: Response,
     job_id: UUID | None = Query(default=None, description="Optional ingestion job ID"),
     job_type: str | None = Query(default=None, description="Optional job type filter"),
     status_filter: str | None = Query(default=None, alias="status", description="Optional status filter"),
     limit: int = Query(default=100, ge=1, le=500, description="Max jobs returned when listing"),
-    db: Session = Depends(get_db),
+    before_created_at: datetime | None = Query(
+        default=None,
+        description="Keyset cursor: created_at of the last job on the previous page",
+    ),
+    before_id: UUID | None = Query(
+        default=None,
+        description="Keyset cursor: id of the last job on the previous page",
+    ),
+    include_payload: bool = Query(
+        default=False,
+        description="Include request/result payloads when listing (always included for a single job_id)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
     orchestrator: IngestionOrchestratorService = Depends(get_ingestion_orchestrator_service),
-) -> IngestionStatusListResponse:
+) -> IngestionStatusListResponse | Response:
     if job_id is not None:
-        job = orchestrator.get_job_status(db=db, job_id=job_id)
+        job = await orchestrator.get_job_status_async(db=db, job_id=job_id)
         if job is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -128,16 +154,70 @@ def get_ingestion_status(
             )
         return IngestionStatusListResponse(jobs=[_to_status_response(job)])
 
-    jobs = orchestrator.list_job_statuses(
+    if (before_created_at is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=build_error_detail(
+                code=SCHEMA_CONFLICT,
+                message="before_created_at and before_id must be provided together.",
+            ),
+        )
+
+    max_updated_at, row_count = await orchestrator.job_list_fingerprint_async(
+        db=db,
+        job_type=job_type,
+        status=status_filter,
+        before_created_at=before_created_at,
+        before_id=before_id,
+    )
+    etag = _list_etag(max_updated_at, row_count, limit=limit, include_payload=include_payload)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    jobs = await orchestrator.list_job_statuses_async(
         db=db,
         limit=limit,
         job_type=job_type,
         status=status_filter,
+        before_created_at=before_created_at,
+        before_id=before_id,
+        include_payload=include_payload,
     )
-    return IngestionStatusListResponse(jobs=[_to_status_response(job) for job in jobs])
+    next_before = None
+    if len(jobs) == limit:
+        last = jobs[-1]
+        next_before = IngestionStatusCursor(before_created_at=last.created_at, before_id=last.id)
+    return IngestionStatusListResponse(
+        jobs=[_to_status_response(job, include_payload=include_payload) for job in jobs],
+        next_before=next_before,
+    )
+
+
+def _list_etag(
+    max_updated_at: datetime | None,
+    row_count: int,
+    *,
+    limit: int,
+    include_payload: bool,
+) -> str:
+    # limit and include_payload shape the body without changing the
+    # fingerprint, so they must be part of the validator too.
+    stamp = max_updated_at.isoformat() if max_updated_at is not None else "-"
+    return f'W/"{stamp}:{row_count}:{limit}:{int(include_payload)}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
-def _to_status_response(job: IngestionJob) -> IngestionJobStatusResponse:
+def _to_status_response(job: IngestionJob, *, include_payload: bool = True) -> IngestionJobStatusResponse:
+    if include_payload:
+        return IngestionJobStatusResponse.model_validate(job)
+    # Payload columns were deferred with raiseload; never touch them here.
     return IngestionJobStatusResponse(
         job_id=job.id,
         job_type=job.job_type,
@@ -146,7 +226,5 @@ def _to_status_response(job: IngestionJob) -> IngestionJobStatusResponse:
         updated_at=job.updated_at,
         started_at=job.started_at,
         completed_at=job.completed_at,
-        request_payload=job.request_payload,
-        result_payload=job.result_payload,
         error_message=job.error_message,
     )
@@ -133,9 +133,9 @@ class IntelligenceOrchestrator:
     extractor:
         Async signal extractor implementing the ``Extractor`` protocol.
     news_connector:
-        Optional sync news connector (``fetch_records()``).
+        Optional async news connector (``fetch_records_async()``).
     trends_connector:
-        Optional sync trends connector (``fetch_records()``).
+        Optional async trends connector (``fetch_records_async()``).
     config:
         ``CompetitorIntelligenceConfig`` (scraper concurrency, query templates …).
     """
@@ -357,7 +357,7 @@ class IntelligenceOrchestrator:
             )
 
     async def _stage_news(self) -> tuple[list[SignalRecord], StageStatus]:
-        """Stage 3a: Fetch news articles via the sync connector."""
+        """Stage 3a: Fetch news articles on the request loop's pooled client."""
         t0 = time.perf_counter()
         if self._news_connector is None:
             return [], StageStatus(
@@ -368,10 +368,7 @@ class IntelligenceOrchestrator:
             )
 
         try:
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None, self._news_connector.fetch_records,
-            )
+            result = await self._news_connector.fetch_records_async()
             signals = [
                 SignalRecord(
                     source="news_api",
@@ -402,7 +399,7 @@ class IntelligenceOrchestrator:
             )
 
     async def _stage_trends(self) -> tuple[list[SignalRecord], StageStatus]:
-        """Stage 3b: Fetch trending keywords via the sync connector."""
+        """Stage 3b: Fetch trending keywords on the request loop's pooled client."""
         t0 = time.perf_counter()
         if self._trends_connector is None:
             return [], StageStatus(
@@ -413,10 +410,7 @@ class IntelligenceOrchestrator:
             )
 
         try:
-            loop = asyncio.get_running_loop()
-            result = await loop.run_in_executor(
-                None, self._trends_connector.fetch_records,
-            )
+            result = await self._trends_connector.fetch_records_async()
             signals: list[SignalRecord] = []
             for rec in result.records:
                 numeric_value = _safe_float(rec.metric_value)
@@ -12,17 +12,14 @@ from functools import lru_cache
 
 from db.config import load_env_files
 
-_ALLOWED_APP_MODES = {"local", "cloud"}
+_ALLOWED_APP_MODES = frozenset({"local", "cloud"})
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
 
+# Project `.env` files are merged into os.environ once, at import, so the
+# `_get_*_env` helpers below are plain environment reads.  os.environ itself
+# stays the source of truth: process env and test monkeypatches still win.
+load_env_files()
 
-@lru_cache(maxsize=1)
-def _load_env_once() -> None:
-    """
-    Ensure project `.env` files are loaded once before reading app settings.
-    """
-
-    load_env_files()
-    
 
 def _require_app_mode() -> str:
     """
@@ -32,8 +29,7 @@ def _require_app_mode() -> str:
     value—or the absence of the variable—raises RuntimeError.
     """
 
-    _load_env_once()
-    raw = os.getenv("APP_MODE")
+    raw = os.environ.get("APP_MODE")
     if raw is None:
         raise RuntimeError("APP_MODE must be explicitly set to 'local' or 'cloud'.")
     mode = raw.strip().lower()
@@ -45,7 +41,7 @@ def _require_app_mode() -> str:
     return mode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """
     Top-level application mode settings.
@@ -70,11 +66,10 @@ def _get_bool_env(name: str, default: bool) -> bool:
     Read a boolean from environment variables with safe fallback.
     """
 
-    _load_env_once()
-    raw_value = os.getenv(name)
+    raw_value = os.environ.get(name)
     if raw_value is None:
         return default
-    return raw_value.strip().lower() in {"1", "true", "yes", "on"}
+    return raw_value.strip().lower() in _TRUTHY_ENV_VALUES
 
 
 def _get_int_env(name: str, default: int) -> int:
@@ -82,8 +77,7 @@ def _get_int_env(name: str, default: int) -> int:
     Read an integer from environment variables with safe fallback.
     """
 
-    _load_env_once()
-    raw_value = os.getenv(name)
+    raw_value = os.environ.get(name)
     if raw_value is None:
         return default
     try:
@@ -97,8 +91,7 @@ def _get_float_env(name: str, default: float) -> float:
     Read a float from environment variables with safe fallback.
     """
 
-    _load_env_once()
-    raw_value = os.getenv(name)
+    raw_value = os.environ.get(name)
     if raw_value is None:
         return default
     try:
@@ -112,8 +105,7 @@ def _get_str_env(name: str, default: str) -> str:
     Read a string from environment variables with fallback.
     """
 
-    _load_env_once()
-    value = os.getenv(name)
+    value = os.environ.get(name)
     if value is None:
         return default
     stripped = value.strip()
@@ -125,15 +117,14 @@ def _get_optional_str_env(name: str) -> str | None:
     Read an optional string value from environment variables.
     """
 
-    _load_env_once()
-    value = os.getenv(name)
+    value = os.environ.get(name)
     if value is None:
         return None
     stripped = value.strip()
     return stripped if stripped else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CSVIngestionSettings:
     """
     Runtime settings for CSV ingestion.
@@ -144,7 +135,7 @@ class CSVIngestionSettings:
     log_validation_errors: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExternalHTTPSettings:
     """
     Shared HTTP behavior settings for external connectors.
@@ -157,7 +148,7 @@ class ExternalHTTPSettings:
     rate_limit_per_second: float = 5.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExternalIngestionSettings:
     """
     Runtime settings for external ingestion orchestration.
@@ -166,7 +157,7 @@ class ExternalIngestionSettings:
     batch_size: int = 1000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewsAPISettings:
     """
     News API connector settings.
@@ -181,7 +172,7 @@ class NewsAPISettings:
     region: str = "global"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoogleTrendsSettings:
     """
     Google Trends connector settings.
@@ -195,7 +186,7 @@ class GoogleTrendsSettings:
     region: str = "US"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorldBankSettings:
     """
     World Bank economic API connector settings.
@@ -209,7 +200,7 @@ class WorldBankSettings:
     latest_periods: int = 20
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FREDSettings:
     """
     FRED macro API settings.
@@ -220,7 +211,7 @@ class FREDSettings:
     base_url: str = "https://api.stlouisfed.org/fred/series/observations"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacroIngestionSettings:
     """
     Runtime settings for macro ingestion pipeline.
@@ -2,25 +2,45 @@
 app/connectors/base.py
 
 Base connector abstraction and shared HTTP mechanics.
+
+Outbound calls go through a pooled ``httpx.AsyncClient`` so connectors can
+fetch concurrently and reuse TCP/TLS sessions across requests.  Connectors
+without an injected client share one client per event loop, so every
+connector fetched on the same loop reuses the same per-host connections.
+
+A client's pool is bound to the event loop that opened it, so the shared
+client cannot outlive its loop: sync callers get a private loop per
+``fetch_records()`` call and the loop's client is closed with it.  The API's
+own loop keeps its client across requests until the lifespan closes it.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cache
 from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
 
-import requests
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json parses bytes too
+    from json import loads as _json_loads
 
 from app.config import ExternalHTTPSettings
 from app.domain.canonical_insight import CanonicalInsightInput
 
 logger = logging.getLogger(__name__)
 
-RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
 
 
 class ConnectorRequestError(RuntimeError):
@@ -29,7 +49,7 @@ class ConnectorRequestError(RuntimeError):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectorFetchResult:
     """
     Connector fetch outcome with normalized records.
@@ -40,6 +60,94 @@ class ConnectorFetchResult:
     failed_records: int = 0
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedFetch:
+    """
+    Validators and normalized result of the last full response for one URL.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    result: ConnectorFetchResult
+
+
+class _TokenBucket:
+    """
+    Token bucket allowing bursts of up to ``rate`` requests, refilled at
+    ``rate`` tokens per second.
+
+    State is guarded by a threading lock rather than an asyncio one so one
+    bucket can be shared by connectors running on different event loops.
+    """
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._rate = rate_per_second
+        self._capacity = max(1.0, rate_per_second)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long to wait before using it.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+            self._last_refill = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            # Negative balance is a reservation: later callers queue behind it.
+            return -self._tokens / self._rate
+
+
+_SHARED_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_client() -> httpx.AsyncClient:
+    """
+    Return the connector client pooled for the running event loop.
+
+    Timeouts differ per connector, so they are passed per request instead of
+    being fixed on the shared client.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _SHARED_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+        _SHARED_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_shared_client() -> None:
+    """
+    Close the running loop's shared client; call before the loop exits.
+    """
+
+    client = _SHARED_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@cache
+def _token_bucket_for(host: str, rate_per_second: float) -> _TokenBucket:
+    """
+    Return the bucket shared by every connector calling ``host`` at this rate.
+    """
+
+    return _TokenBucket(rate_per_second)
+
+
 class BaseConnector(ABC):
     """
     Connector interface for fetching and normalizing external records.
@@ -52,26 +160,50 @@ class BaseConnector(ABC):
         *,
         source: str,
         http_settings: ExternalHTTPSettings,
-        session: requests.Session | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.source = source
-        self._session = session or requests.Session()
+        self._client = client
         self._timeout_seconds = http_settings.timeout_seconds
         self._max_retries = http_settings.max_retries
         self._backoff_initial_seconds = http_settings.backoff_initial_seconds
         self._backoff_multiplier = http_settings.backoff_multiplier
-        self._min_request_interval_seconds = (
-            1.0 / http_settings.rate_limit_per_second if http_settings.rate_limit_per_second > 0 else 0.0
-        )
-        self._last_request_monotonic: float = 0.0
+        self._rate_limit_per_second = http_settings.rate_limit_per_second
+        self._cached_fetches: dict[str, _CachedFetch] = {}
 
     @abstractmethod
-    def fetch_records(self) -> ConnectorFetchResult:
+    async def fetch_records_async(self) -> ConnectorFetchResult:
         """
         Fetch external data and return normalized canonical records.
         """
 
-    def _request_json(
+    def fetch_records(self) -> ConnectorFetchResult:
+        """
+        Sync entrypoint for threadpool / background-job callers.
+        """
+
+        return asyncio.run(self._fetch_records_then_close())
+
+    async def _fetch_records_then_close(self) -> ConnectorFetchResult:
+        try:
+            return await self.fetch_records_async()
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the running loop's shared client unless a client was injected.
+        """
+
+        if self._client is None:
+            await aclose_shared_client()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        return _shared_client()
+
+    async def _request_json(
         self,
         *,
         method: str,
@@ -83,13 +215,14 @@ class BaseConnector(ABC):
         Execute an HTTP request and return parsed JSON with retry support.
         """
 
-        response = self._request(method=method, url=url, params=params, headers=headers)
+        response = await self._request(method=method, url=url, params=params, headers=headers)
         try:
-            return response.json()
+            # Decode straight from bytes, skipping the ``.text`` decode step.
+            return _json_loads(response.content)
         except ValueError as exc:
             raise ConnectorRequestError(f"{self.source}: response was not valid JSON.") from exc
 
-    def _request_text(
+    async def _request_text(
         self,
         *,
         method: str,
@@ -101,54 +234,43 @@ class BaseConnector(ABC):
         Execute an HTTP request and return response text with retry support.
         """
 
-        response = self._request(method=method, url=url, params=params, headers=headers)
+        response = await self._request(method=method, url=url, params=params, headers=headers)
         return response.text
 
-    def _request(
+    async def _request(
         self,
         *,
         method: str,
         url: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """
         Execute an HTTP request with rate limiting and exponential backoff.
         """
 
+        client = self._get_client()
         last_error: Exception | None = None
         for attempt in range(self._max_retries + 1):
-            self._apply_rate_limit()
+            await self._apply_rate_limit(url)
             try:
-                response = self._session.request(
-                    method=method,
-                    url=url,
+                response = await client.request(
+                    method,
+                    url,
                     params=params,
                     headers=headers,
                     timeout=self._timeout_seconds,
                 )
-                if response.status_code in RETRYABLE_STATUS_CODES:
-                    raise requests.HTTPError(
-                        f"Retryable HTTP status code: {response.status_code}",
-                        response=response,
-                    )
-                response.raise_for_status()
-                return response
-            except requests.HTTPError as exc:
-                last_error = exc
-                status_code = exc.response.status_code if exc.response is not None else None
-                is_retryable = status_code in RETRYABLE_STATUS_CODES
-                if not is_retryable:
-                    logger.error(
-                        "Connector request failed source=%s status=%s url=%s error=%s",
-                        self.source,
-                        status_code,
-                        url,
-                        exc,
-                    )
-                    raise ConnectorRequestError(f"{self.source}: non-retryable request failure.") from exc
-            except (requests.Timeout, requests.ConnectionError) as exc:
+            except httpx.TransportError as exc:
                 last_error = exc
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return self._checked_response(response, url=url)
+                last_error = httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code} for url {url}",
+                    request=response.request,
+                    response=response,
+                )
 
             if attempt >= self._max_retries:
                 break
@@ -162,7 +284,7 @@ class BaseConnector(ABC):
                 backoff_seconds,
                 url,
             )
-            time.sleep(backoff_seconds)
+            await asyncio.sleep(backoff_seconds)
 
         logger.error(
             "Connector request exhausted retries source=%s url=%s error=%s",
@@ -172,29 +294,89 @@ class BaseConnector(ABC):
         )
         raise ConnectorRequestError(f"{self.source}: request failed after retries.") from last_error
 
-    def _apply_rate_limit(self) -> None:
+    def _checked_response(self, response: httpx.Response, *, url: str) -> httpx.Response:
         """
-        Enforce minimum interval between outbound requests.
+        Return ``response`` if successful or not modified, else fail without retrying.
         """
 
-        if self._min_request_interval_seconds <= 0:
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return response
+        try:
+            return response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            logger.error(
+                "Connector request failed source=%s status=%s url=%s error=%s",
+                self.source,
+                response.status_code,
+                url,
+                exc,
+            )
+            raise ConnectorRequestError(f"{self.source}: non-retryable request failure.") from exc
+
+    def _conditional_headers(self, key: str) -> dict[str, str] | None:
+        """
+        Return ``If-None-Match`` / ``If-Modified-Since`` for a remembered fetch.
+        """
+
+        cached = self._cached_fetches.get(key)
+        if cached is None:
+            return None
+        headers: dict[str, str] = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _not_modified_result(self, key: str, response: httpx.Response) -> ConnectorFetchResult | None:
+        """
+        Return the remembered result when the server answered 304 for ``key``.
+        """
+
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            return None
+        cached = self._cached_fetches.get(key)
+        if cached is None:
+            raise ConnectorRequestError(f"{self.source}: unexpected 304 without cached validators.")
+        return cached.result
+
+    def _remember_fetch(self, key: str, response: httpx.Response, result: ConnectorFetchResult) -> None:
+        """
+        Keep ``result`` for revalidation if the response carried validators.
+        """
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cached_fetches[key] = _CachedFetch(etag, last_modified, result)
+        else:
+            self._cached_fetches.pop(key, None)
+
+    async def _apply_rate_limit(self, url: str) -> None:
+        """
+        Wait for a token from the bucket shared by all connectors on this host.
+        """
+
+        if self._rate_limit_per_second <= 0:
             return
 
-        now = time.monotonic()
-        elapsed = now - self._last_request_monotonic
-        remaining = self._min_request_interval_seconds - elapsed
-        if remaining > 0:
-            time.sleep(remaining)
-        self._last_request_monotonic = time.monotonic()
+        bucket = _token_bucket_for(urlsplit(url).netloc, self._rate_limit_per_second)
+        wait_seconds = bucket.reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
 
     @staticmethod
     def parse_iso_datetime(value: str) -> datetime:
         """
         Parse an ISO datetime string into a timezone-aware datetime.
+
+        A trailing ``Z`` is rewritten to ``+00:00``: ``fromisoformat`` only
+        accepts it from Python 3.11, and 3.10 is still supported.
         """
 
-        normalized = value[:-1] + "+00:00" if value.endswith("Z") else value
-        parsed = datetime.fromisoformat(normalized)
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             return parsed.replace(tzinfo=timezone.utc)
         return parsed
@@ -2,16 +2,26 @@
 app/connectors/google_trends_connector.py
 
 Google Trends connector using the public trending RSS feed.
+
+The feed is parsed with lxml (already installed with trafilatura) using
+``iterparse``: each ``<item>`` is normalized as soon as it is complete and
+then cleared, so the tree never holds more than the current item, and
+parsing stops once ``max_items`` have been read.
 """
 
 from __future__ import annotations
 
 import logging
-import xml.etree.ElementTree as ET
-from datetime import timezone
+import re
+from collections.abc import Iterator
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from io import BytesIO
+from itertools import islice
 from typing import Any
 
+from lxml import etree
+
 from app.config import ExternalHTTPSettings, GoogleTrendsSettings
 from app.connectors.base import BaseConnector, ConnectorFetchResult
 from app.domain.canonical_insight import CanonicalInsightInput
@@ -19,6 +29,29 @@ from db.models.canonical_insight_record import CanonicalCategory, CanonicalSourc
 
 logger = logging.getLogger(__name__)
 
+_SOURCE_TYPE = CanonicalSourceType.SCRAPE
+_CATEGORY = CanonicalCategory.MARKETING
+
+# Item fields as compiled XPath string() lookups, evaluated in C per item.
+# Plain (non-smart) strings keep no reference back to the cleared item.
+# ``ht:`` moved namespace when the daily feed was retired; accept both.
+_TRENDS_NAMESPACES = {
+    "ht": "https://trends.google.com/trending/rss",
+    "ht_daily": "https://trends.google.com/trends/trendingsearches/daily",
+}
+_ITEM_TITLE = etree.XPath("string(title)", smart_strings=False)
+_ITEM_PUB_DATE = etree.XPath("string(pubDate)", smart_strings=False)
+_ITEM_LINK = etree.XPath("string(link)", smart_strings=False)
+_ITEM_APPROX_TRAFFIC = etree.XPath(
+    "string((ht:approx_traffic | ht_daily:approx_traffic)[1])",
+    namespaces=_TRENDS_NAMESPACES,
+    smart_strings=False,
+)
+
+# "200K+", "1,000+", "2M": number, optional magnitude suffix, optional "+".
+_TRAFFIC_RE = re.compile(r"\s*([\d.,]+)\s*([KM]?)\s*\+?\s*$", re.IGNORECASE)
+_TRAFFIC_MULTIPLIERS = {"": 1, "K": 1_000, "M": 1_000_000}
+
 
 class GoogleTrendsConnector(BaseConnector):
     """
@@ -33,77 +66,79 @@ class GoogleTrendsConnector(BaseConnector):
     ) -> None:
         super().__init__(source="google_trends", http_settings=http_settings)
         self._settings = settings
+        self._metadata_template = {"geo": settings.geo, "hl": settings.hl}
 
-    def fetch_records(self) -> ConnectorFetchResult:
+    async def fetch_records_async(self) -> ConnectorFetchResult:
         if not self._settings.enabled:
             return ConnectorFetchResult(source=self.source, records=[], failed_records=0)
 
-        xml_text = self._request_text(
+        # The feed is revalidated with its ETag/Last-Modified: an unchanged
+        # feed answers 304 and the previous result is reused without a parse.
+        cache_key = self._settings.rss_url
+        response = await self._request(
             method="GET",
             url=self._settings.rss_url,
             params={"geo": self._settings.geo, "hl": self._settings.hl},
+            headers=self._conditional_headers(cache_key),
         )
-
-        try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as exc:
-            logger.error("Failed to parse Google Trends RSS response: %s", exc)
-            return ConnectorFetchResult(source=self.source, records=[], failed_records=1)
+        not_modified = self._not_modified_result(cache_key, response)
+        if not_modified is not None:
+            return not_modified
 
         records: list[CanonicalInsightInput] = []
         failed_records = 0
 
-        items = root.findall(".//item")
-        for index, item in enumerate(items[: self._settings.max_items]):
-            try:
-                normalized = self._normalize_item(item)
-                if normalized is None:
+        items = islice(_iter_items(response.content), self._settings.max_items)
+        try:
+            for index, item in enumerate(items):
+                try:
+                    normalized = self._normalize_item(item)
+                    if normalized is None:
+                        failed_records += 1
+                        continue
+                    records.append(normalized)
+                except Exception as exc:
                     failed_records += 1
-                    continue
-                records.append(normalized)
-            except Exception as exc:
-                failed_records += 1
-                logger.warning(
-                    "Failed to normalize Google Trends item index=%s error=%s",
-                    index,
-                    exc,
-                )
-
-        return ConnectorFetchResult(
+                    logger.warning(
+                        "Failed to normalize Google Trends item index=%s error=%s",
+                        index,
+                        exc,
+                    )
+        except etree.XMLSyntaxError as exc:
+            # Items completed before the syntax error are kept.
+            logger.error("Failed to parse Google Trends RSS response: %s", exc)
+            failed_records += 1
+
+        result = ConnectorFetchResult(
             source=self.source,
             records=records,
             failed_records=failed_records,
         )
+        self._remember_fetch(cache_key, response, result)
+        return result
 
-    def _normalize_item(self, item: ET.Element) -> CanonicalInsightInput | None:
-        keyword = (self._child_text(item, "title") or "").strip()
-        pub_date = (self._child_text(item, "pubDate") or "").strip()
+    def _normalize_item(self, item: etree._Element) -> CanonicalInsightInput | None:
+        keyword = _ITEM_TITLE(item).strip()
+        pub_date = _ITEM_PUB_DATE(item).strip()
         if not keyword or not pub_date:
             return None
 
-        try:
-            timestamp = parsedate_to_datetime(pub_date)
-        except (TypeError, ValueError):
+        timestamp = self._parse_pub_date(pub_date)
+        if timestamp is None:
             return None
-        if timestamp.tzinfo is None:
-            timestamp = timestamp.replace(tzinfo=timezone.utc)
 
-        approx_traffic_raw = (self._child_text(item, "approx_traffic") or "").strip()
-        approx_traffic = self._parse_traffic(approx_traffic_raw)
-        link = (self._child_text(item, "link") or "").strip()
+        approx_traffic_raw = _ITEM_APPROX_TRAFFIC(item).strip()
+        approx_traffic = _parse_traffic(approx_traffic_raw)
+        link = _ITEM_LINK(item).strip()
 
-        metadata_json: dict[str, Any] = {
-            "geo": self._settings.geo,
-            "hl": self._settings.hl,
-            "link": link or None,
-        }
+        metadata_json: dict[str, Any] = {**self._metadata_template, "link": link or None}
         if approx_traffic_raw:
             metadata_json["approx_traffic_raw"] = approx_traffic_raw
 
         return CanonicalInsightInput(
-            source_type=CanonicalSourceType.SCRAPE,
+            source_type=_SOURCE_TYPE,
             entity_name=keyword,
-            category=CanonicalCategory.MARKETING,
+            category=_CATEGORY,
             metric_name="trend_keyword_traffic",
             metric_value=approx_traffic if approx_traffic is not None else approx_traffic_raw,
             timestamp=timestamp,
@@ -112,28 +147,50 @@ class GoogleTrendsConnector(BaseConnector):
         )
 
     @staticmethod
-    def _child_text(node: ET.Element, local_name: str) -> str | None:
-        for child in list(node):
-            tag_name = child.tag.rsplit("}", 1)[-1]
-            if tag_name == local_name:
-                return child.text
-        return None
-
-    @staticmethod
-    def _parse_traffic(raw_value: str) -> int | None:
-        if not raw_value:
+    def _parse_pub_date(pub_date: str) -> datetime | None:
+        # RSS mandates RFC 2822 ("Sun, 01 Mar ..."), but ISO 8601 stamps
+        # start with a digit and go through the shared ISO parser instead.
+        try:
+            if pub_date[:1].isdigit():
+                return BaseConnector.parse_iso_datetime(pub_date)
+            timestamp = parsedate_to_datetime(pub_date)
+        except (TypeError, ValueError):
             return None
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp
 
-        cleaned = raw_value.strip().upper().replace("+", "").replace(",", "")
-        multiplier = 1
-        if cleaned.endswith("K"):
-            multiplier = 1_000
-            cleaned = cleaned[:-1]
-        elif cleaned.endswith("M"):
-            multiplier = 1_000_000
-            cleaned = cleaned[:-1]
 
-        try:
-            return int(float(cleaned) * multiplier)
-        except ValueError:
-            return None
+def _iter_items(xml_bytes: bytes) -> Iterator[etree._Element]:
+    """
+    Yield each completed ``<item>``, clearing it once the caller moves on.
+
+    Feed content is untrusted: entity expansion and network access are off.
+    """
+
+    for _event, item in etree.iterparse(
+        BytesIO(xml_bytes),
+        events=("end",),
+        tag="item",
+        resolve_entities=False,
+        no_network=True,
+    ):
+        yield item
+        item.clear(keep_tail=True)
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+
+def _parse_traffic(raw_value: str) -> int | None:
+    """
+    Parse an ``approx_traffic`` label such as ``"200K+"`` or ``"1,000+"``.
+    """
+
+    match = _TRAFFIC_RE.match(raw_value)
+    if match is None:
+        return None
+    digits, suffix = match.groups()
+    try:
+        return int(float(digits.replace(",", "")) * _TRAFFIC_MULTIPLIERS[suffix.upper()])
+    except ValueError:
+        return None
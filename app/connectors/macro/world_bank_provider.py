@@ -6,6 +6,7 @@ World Bank macro provider implementation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import requests
@@ -118,4 +119,10 @@ class WorldBankMacroProvider(BaseMacroProvider):
         year = cls._extract_year(str(value) if value is not None else None)
         if year is None:
             return None
-        return (f"{year:04d}-01-01", f"{year:04d}-12-31")
+        return _year_bounds(year)
+
+
+@lru_cache(maxsize=256)
+def _year_bounds(year: int) -> tuple[str, str]:
+    # Indicator histories span a few dozen distinct years; build each once.
+    return (f"{year:04d}-01-01", f"{year:04d}-12-31")
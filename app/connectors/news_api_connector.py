@@ -17,6 +17,9 @@ from db.models.canonical_insight_record import CanonicalCategory, CanonicalSourc
 
 logger = logging.getLogger(__name__)
 
+_SOURCE_TYPE = CanonicalSourceType.API
+_CATEGORY = CanonicalCategory.EVENT
+
 
 class NewsAPIConnector(BaseConnector):
     """
@@ -31,8 +34,9 @@ class NewsAPIConnector(BaseConnector):
     ) -> None:
         super().__init__(source="news_api", http_settings=http_settings)
         self._settings = settings
+        self._metadata_template = {"query": settings.query, "language": settings.language}
 
-    def fetch_records(self) -> ConnectorFetchResult:
+    async def fetch_records_async(self) -> ConnectorFetchResult:
         if not self._settings.enabled:
             return ConnectorFetchResult(source=self.source, records=[], failed_records=0)
 
@@ -40,7 +44,7 @@ class NewsAPIConnector(BaseConnector):
             logger.error("NEWS_API_KEY is missing; skipping News API ingestion.")
             return ConnectorFetchResult(source=self.source, records=[], failed_records=1)
 
-        payload = self._request_json(
+        payload = await self._request_json(
             method="GET",
             url=self._settings.base_url,
             params={
@@ -91,7 +95,9 @@ class NewsAPIConnector(BaseConnector):
         except ValueError:
             return None
 
-        source_meta = article.get("source") if isinstance(article.get("source"), dict) else {}
+        source_meta = article.get("source")
+        if not isinstance(source_meta, dict):
+            source_meta = {}
         entity_name = (source_meta.get("name") or "global_news").strip()
         if not entity_name:
             entity_name = "global_news"
@@ -104,15 +110,14 @@ class NewsAPIConnector(BaseConnector):
 
         metadata_json = {
             "author": article.get("author"),
-            "query": self._settings.query,
-            "language": self._settings.language,
+            **self._metadata_template,
             "content_preview": article.get("content"),
         }
 
         return CanonicalInsightInput(
-            source_type=CanonicalSourceType.API,
+            source_type=_SOURCE_TYPE,
             entity_name=entity_name,
-            category=CanonicalCategory.EVENT,
+            category=_CATEGORY,
             metric_name="news_article",
             metric_value=metric_payload,
             timestamp=timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc),
@@ -6,8 +6,10 @@ World Bank connector for macro-economic indicators.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Mapping
 
 from app.config import ExternalHTTPSettings, WorldBankSettings
@@ -22,6 +24,9 @@ from db.models.canonical_insight_record import CanonicalCategory, CanonicalSourc
 
 logger = logging.getLogger(__name__)
 
+_SOURCE_TYPE = CanonicalSourceType.API
+_CATEGORY = CanonicalCategory.MACRO
+
 
 class WorldBankConnector(BaseConnector):
     """
@@ -37,6 +42,7 @@ class WorldBankConnector(BaseConnector):
     ) -> None:
         super().__init__(source="world_bank", http_settings=http_settings)
         self._settings = settings
+        self._metadata_template = {"country_code": settings.country_code}
         self._provider = provider or WorldBankMacroProvider(
             http_settings=http_settings,
             base_url=settings.base_url,
@@ -44,12 +50,14 @@ class WorldBankConnector(BaseConnector):
             latest_periods=settings.latest_periods,
         )
 
-    def fetch_records(self) -> ConnectorFetchResult:
+    async def fetch_records_async(self) -> ConnectorFetchResult:
         if not self._settings.enabled:
             return ConnectorFetchResult(source=self.source, records=[], failed_records=0)
 
         try:
-            rows = self._provider.fetch(
+            # Macro providers keep their own sync HTTP stack; offload it.
+            rows = await asyncio.to_thread(
+                self._provider.fetch,
                 country=self._settings.country_code,
                 metric=self._settings.indicator_code,
                 limit=self._settings.latest_periods,
@@ -100,16 +108,16 @@ class WorldBankConnector(BaseConnector):
         source_name = str(row.get("source") or self.source).strip() or self.source
 
         metadata_json = {
-            "country_code": self._settings.country_code,
+            **self._metadata_template,
             "provider": source_name,
             "period_start": period_start,
             "period_end": period_end,
         }
 
         return CanonicalInsightInput(
-            source_type=CanonicalSourceType.API,
+            source_type=_SOURCE_TYPE,
             entity_name=country_name,
-            category=CanonicalCategory.MACRO,
+            category=_CATEGORY,
             metric_name=metric_name,
             metric_value=value,
             timestamp=timestamp,
@@ -118,9 +126,14 @@ class WorldBankConnector(BaseConnector):
         )
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _parse_period_end(period_raw: str) -> datetime | None:
+        # Period ends repeat across indicators and runs (one per year or
+        # quarter), and the parsed datetimes are immutable, so memoize them.
+        if period_raw.endswith("Z"):
+            period_raw = period_raw[:-1] + "+00:00"
         try:
-            parsed = datetime.fromisoformat(period_raw.replace("Z", "+00:00"))
+            parsed = datetime.fromisoformat(period_raw)
         except (TypeError, ValueError):
             return None
         if parsed.tzinfo is None:
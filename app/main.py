@@ -198,6 +198,12 @@ async def _lifespan(application: FastAPI) -> AsyncIterator[None]:
         scheduler.shutdown(wait=True)
         logging.getLogger(__name__).info("Scheduler shut down")
 
+        from app.connectors.base import aclose_shared_client
+        from db.async_session import dispose_async_engine
+
+        await aclose_shared_client()
+        await dispose_async_engine()
+
 
 def create_app() -> FastAPI:
     """
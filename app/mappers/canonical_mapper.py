@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Mapping, Sequence
 
 from rapidfuzz import fuzz, process
@@ -201,7 +202,24 @@ CATEGORY_AWARE_ALIASES: dict[str, dict[str, tuple[str, ...]]] = {
 
 def normalize_header(header: str) -> str:
     """Normalize a column name: lowercase, strip non-alphanumeric."""
-    return "".join(ch for ch in header.strip().lower() if ch.isalnum())
+    return _normalize_cached(header)
+
+
+# Deletes every ASCII character that is not alphanumeric.
+_ASCII_NON_ALNUM = str.maketrans(
+    "", "", "".join(chr(cp) for cp in range(128) if not chr(cp).isalnum())
+)
+
+
+# Canonical fields and aliases are normalized again for every CSV resolved;
+# the cache turns that into one pass per distinct string.
+@lru_cache(maxsize=4096)
+def _normalize_cached(header: str) -> str:
+    lowered = header.strip().lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_NON_ALNUM)
+    # Unicode letters/digits (e.g. "é", "²") are kept, as ``isalnum`` does.
+    return "".join(ch for ch in lowered if ch.isalnum())
 
 
 # ---------------------------------------------------------------------------
@@ -421,8 +439,8 @@ class ColumnMapper:
         if ambiguous_errors:
             raise AmbiguousColumnMatchError(errors=ambiguous_errors)
 
-        missing = [f for f in required_fields if f not in mapping]
-        if missing:
+        if not mapping.keys() >= set(required_fields):
+            missing = [f for f in required_fields if f not in mapping]
             raise MissingRequiredColumnsError(missing=missing, headers=headers)
 
         return ColumnMapping(
@@ -533,12 +551,15 @@ class ColumnMapper:
             return None
 
         normalized_candidates = [
-            normalize_header(c) for c in candidates if normalize_header(c)
+            norm for norm in map(normalize_header, candidates) if norm
         ]
         if not normalized_candidates:
             return None
 
         available_norms = list(available.keys())
+        # A header scoring below this can neither win nor be a near match, so
+        # rapidfuzz may reject it early (e.g. on length difference alone).
+        score_cutoff = max(0.0, self._fuzzy_threshold - _AMBIGUITY_RANGE)
         header_scores: dict[str, float] = {}
         for candidate in normalized_candidates:
             results = process.extract(
@@ -546,6 +567,7 @@ class ColumnMapper:
                 available_norms,
                 scorer=fuzz.token_sort_ratio,
                 limit=len(available_norms),
+                score_cutoff=score_cutoff,
             )
             for match_norm, score, _ in results:
                 header = available[match_norm]
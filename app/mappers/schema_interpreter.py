@@ -133,7 +133,7 @@ def _alias_exact_score(
 def _fuzzy_score(source_norm: str, canonical_field: str, aliases: Sequence[str]) -> float:
     """Best fuzzy similarity (0–1) across field name and all aliases."""
     candidates = [normalize_header(canonical_field)]
-    candidates.extend(normalize_header(a) for a in aliases if normalize_header(a))
+    candidates.extend(norm for norm in map(normalize_header, aliases) if norm)
 
     best = 0.0
     for candidate in candidates:
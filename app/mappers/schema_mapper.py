@@ -11,9 +11,11 @@ MappingValidator enforcement on top.
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Mapping, Sequence
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
 from app.domain.canonical_insight import CanonicalInsightInput
@@ -34,6 +36,8 @@ from db.models.canonical_insight_record import CanonicalInsightRecord
 
 logger = logging.getLogger(__name__)
 
+_RESOLUTION_CACHE_SIZE = 256
+
 
 @dataclass(frozen=True)
 class MappingResolution:
@@ -63,6 +67,7 @@ class SchemaMapper:
         validator: MappingValidator | None = None,
         fuzzy_threshold: float = 80.0,
         category_hint: str | None = None,
+        fuzzy_workers: int = 1,
     ) -> None:
         self._aliases: dict[str, tuple[str, ...]] = {
             canonical: tuple(values)
@@ -73,11 +78,16 @@ class SchemaMapper:
             canonical_fields=CANONICAL_FIELDS,
         )
         self._fuzzy_threshold = max(0.0, min(100.0, fuzzy_threshold))
+        # rapidfuzz cdist threads (-1 = all cores). Defaults to 1 because the
+        # mapper usually runs inside already-parallel ingestion workers.
+        self._fuzzy_workers = fuzzy_workers
         self._category_hint = category_hint
         self._interpreter = SchemaInterpreter(
             aliases=aliases,
             category_hint=category_hint,
         )
+        self._resolution_cache: dict[tuple[Any, ...], tuple[dict[str, str], dict[str, str]]] = {}
+        self._resolution_cache_lock = threading.Lock()
 
     def resolve_mapping(
         self,
@@ -101,9 +111,9 @@ class SchemaMapper:
         """
         source_headers = tuple(header for header in headers if header and header.strip())
         normalized_header_lookup: dict[str, str] = {
-            normalize_header(header): header
+            norm: header
             for header in source_headers
-            if normalize_header(header)
+            if (norm := normalize_header(header))
         }
         if not source_headers:
             raise SchemaMappingError(
@@ -121,6 +131,98 @@ class SchemaMapper:
             manual_overrides=manual_overrides,
         )
 
+        # Resolve category hint (parameter > constructor > None)
+        active_category = (category_hint or self._category_hint or "").strip().lower() or None
+
+        # Same headers + overrides + config resolve identically, so repeat
+        # files from one export skip matching. The interpreter still runs
+        # below because its scores depend on each file's sample rows.
+        cache_key = self._resolution_cache_key(
+            source_headers=source_headers,
+            overrides=overrides,
+            mapping_config=mapping_config,
+            active_category=active_category,
+        )
+        cached = self._cached_resolution(cache_key)
+        if cached is None:
+            resolved, strategies = self._resolve_fields(
+                source_headers=source_headers,
+                normalized_header_lookup=normalized_header_lookup,
+                overrides=overrides,
+                mapping_config=mapping_config,
+                active_category=active_category,
+            )
+            self._remember_resolution(cache_key, resolved, strategies)
+        else:
+            resolved, strategies = dict(cached[0]), dict(cached[1])
+
+        config_id = None
+        if mapping_config is not None:
+            raw_id = getattr(mapping_config, "id", None)
+            config_id = str(raw_id) if raw_id is not None else None
+
+        # Run interpreter for audit/scoring metadata
+        interpretation = self._interpreter.interpret(
+            headers,
+            sample_rows=sample_rows,
+            category_hint=active_category,
+        )
+
+        # Log interpreter warnings
+        for warning in interpretation.warnings:
+            logger.warning("SchemaInterpreter: %s", warning)
+        for error in interpretation.errors:
+            logger.error("SchemaInterpreter: %s", error)
+
+        return MappingResolution(
+            canonical_to_source=resolved,
+            source_headers=source_headers,
+            match_strategies=strategies,
+            mapping_config_id=config_id,
+            interpretation=interpretation,
+        )
+
+    def map_row(
+        self,
+        *,
+        raw_row: Mapping[str, str | None],
+        mapping: MappingResolution,
+    ) -> dict[str, str | None]:
+        """Map one source CSV row into canonical raw field values."""
+        return {
+            canonical_field: raw_row.get(source_column)
+            for canonical_field, source_column in mapping.canonical_to_source.items()
+        }
+
+    @staticmethod
+    def to_canonical_record(value: CanonicalInsightInput) -> CanonicalInsightRecord:
+        """Convert validated canonical input into a canonical record model object."""
+        return CanonicalInsightRecord(
+            source_type=value.source_type,
+            entity_name=value.entity_name,
+            category=value.category,
+            role=value.role,
+            metric_name=value.metric_name,
+            metric_value=value.metric_value,
+            timestamp=value.timestamp,
+            region=value.region,
+            metadata_json=value.metadata_json,
+        )
+
+    # ------------------------------------------------------------------
+    # Field resolution
+    # ------------------------------------------------------------------
+
+    def _resolve_fields(
+        self,
+        *,
+        source_headers: tuple[str, ...],
+        normalized_header_lookup: Mapping[str, str],
+        overrides: Mapping[str, str],
+        mapping_config: Any | None,
+        active_category: str | None,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Run override → exact/alias → fuzzy resolution and validate the result."""
         resolved: dict[str, str] = {}
         strategies: dict[str, str] = {}
         mapping_errors: list[MappingErrorDetail] = []
@@ -155,18 +257,18 @@ class SchemaMapper:
             resolved[normalized_canonical] = matched_source
             strategies[normalized_canonical] = "override"
 
-        # Resolve category hint (parameter > constructor > None)
-        active_category = (category_hint or self._category_hint or "").strip().lower() or None
-
         used_headers = set(resolved.values())
-        for canonical_field in CANONICAL_FIELDS:
-            if canonical_field in resolved:
-                continue
-
-            candidates = self._build_candidates(
+        candidates_by_field = {
+            canonical_field: self._build_candidates(
                 canonical_field, mapping_config, active_category
             )
-
+            for canonical_field in CANONICAL_FIELDS
+            if canonical_field not in resolved
+        }
+        header_norms = list(normalized_header_lookup)
+        header_sources = list(normalized_header_lookup.values())
+        fuzzy_scores: dict[str, np.ndarray] | None = None
+        for canonical_field, candidates in candidates_by_field.items():
             # Phase 1: Exact/alias match
             exact = self._find_exact_or_alias_match(
                 candidates=candidates,
@@ -179,10 +281,21 @@ class SchemaMapper:
                 used_headers.add(exact)
                 continue
 
-            # Phase 2: Fuzzy match (rapidfuzz)
+            # Phase 2: Fuzzy match (rapidfuzz). Scored lazily, so headers that
+            # all match exactly never build the matrix, and only for fields
+            # still unresolved at that point.
+            if fuzzy_scores is None:
+                fuzzy_scores = self._fuzzy_header_scores(
+                    candidates_by_field={
+                        field_name: field_candidates
+                        for field_name, field_candidates in candidates_by_field.items()
+                        if field_name not in resolved
+                    },
+                    header_norms=header_norms,
+                )
             fuzzy_match = self._find_best_fuzzy_match(
-                candidates=candidates,
-                normalized_header_lookup=normalized_header_lookup,
+                header_scores=fuzzy_scores.get(canonical_field),
+                header_sources=header_sources,
                 used_headers=used_headers,
             )
             if fuzzy_match is not None:
@@ -196,59 +309,54 @@ class SchemaMapper:
             pre_errors=mapping_errors,
         )
 
-        config_id = None
-        if mapping_config is not None:
-            raw_id = getattr(mapping_config, "id", None)
-            config_id = str(raw_id) if raw_id is not None else None
+        return resolved, strategies
 
-        # Run interpreter for audit/scoring metadata
-        active_category = (category_hint or self._category_hint or "").strip().lower() or None
-        interpretation = self._interpreter.interpret(
-            headers,
-            sample_rows=sample_rows,
-            category_hint=active_category,
+    @staticmethod
+    def _resolution_cache_key(
+        *,
+        source_headers: tuple[str, ...],
+        overrides: Mapping[str, str],
+        mapping_config: Any | None,
+        active_category: str | None,
+    ) -> tuple[Any, ...] | None:
+        """Key for reusing a resolution; None when the config cannot be identified."""
+        config_key: tuple[Any, ...] | None = None
+        if mapping_config is not None:
+            config_id = getattr(mapping_config, "id", None)
+            if config_id is None:
+                return None
+            # updated_at changes whenever the config's mappings/aliases do.
+            config_key = (str(config_id), getattr(mapping_config, "updated_at", None))
+        return (
+            source_headers,
+            tuple(sorted(overrides.items())),
+            config_key,
+            active_category,
         )
 
-        # Log interpreter warnings
-        for warning in interpretation.warnings:
-            logger.warning("SchemaInterpreter: %s", warning)
-        for error in interpretation.errors:
-            logger.error("SchemaInterpreter: %s", error)
-
-        return MappingResolution(
-            canonical_to_source=resolved,
-            source_headers=source_headers,
-            match_strategies=strategies,
-            mapping_config_id=config_id,
-            interpretation=interpretation,
-        )
+    def _cached_resolution(
+        self, key: tuple[Any, ...] | None
+    ) -> tuple[dict[str, str], dict[str, str]] | None:
+        if key is None:
+            return None
+        with self._resolution_cache_lock:
+            return self._resolution_cache.get(key)
 
-    def map_row(
+    def _remember_resolution(
         self,
-        *,
-        raw_row: Mapping[str, str | None],
-        mapping: MappingResolution,
-    ) -> dict[str, str | None]:
-        """Map one source CSV row into canonical raw field values."""
-        return {
-            canonical_field: raw_row.get(source_column)
-            for canonical_field, source_column in mapping.canonical_to_source.items()
-        }
-
-    @staticmethod
-    def to_canonical_record(value: CanonicalInsightInput) -> CanonicalInsightRecord:
-        """Convert validated canonical input into a canonical record model object."""
-        return CanonicalInsightRecord(
-            source_type=value.source_type,
-            entity_name=value.entity_name,
-            category=value.category,
-            role=value.role,
-            metric_name=value.metric_name,
-            metric_value=value.metric_value,
-            timestamp=value.timestamp,
-            region=value.region,
-            metadata_json=value.metadata_json,
-        )
+        key: tuple[Any, ...] | None,
+        resolved: dict[str, str],
+        strategies: dict[str, str],
+    ) -> None:
+        if key is None:
+            return
+        with self._resolution_cache_lock:
+            if key not in self._resolution_cache and (
+                len(self._resolution_cache) >= _RESOLUTION_CACHE_SIZE
+            ):
+                # FIFO: dicts iterate in insertion order.
+                del self._resolution_cache[next(iter(self._resolution_cache))]
+            self._resolution_cache[key] = (dict(resolved), dict(strategies))
 
     # ------------------------------------------------------------------
     # Candidate construction
@@ -297,51 +405,65 @@ class SchemaMapper:
                 return match
         return None
 
-    def _find_best_fuzzy_match(
+    def _fuzzy_header_scores(
         self,
         *,
-        candidates: Sequence[str],
-        normalized_header_lookup: Mapping[str, str],
-        used_headers: set[str],
-    ) -> str | None:
-        """Find best fuzzy match using rapidfuzz.
-
-        Uses token_sort_ratio for word-order resilience and partial_ratio
-        for substring containment. Best score across both scorers wins.
+        candidates_by_field: Mapping[str, Sequence[str]],
+        header_norms: Sequence[str],
+    ) -> dict[str, np.ndarray]:
+        """Score every header against each field's candidates using rapidfuzz.
+
+        All candidates are scored in one ``process.cdist`` call per scorer:
+        token_sort_ratio for word-order resilience and partial_ratio for
+        substring containment. Each field gets its best score per header
+        across its candidates and both scorers; scores below the threshold
+        are zeroed.
         """
-        available: dict[str, str] = {
-            norm: raw
-            for norm, raw in normalized_header_lookup.items()
-            if raw not in used_headers
-        }
-        if not available:
-            return None
-
-        normalized_candidates = [
-            normalize_header(c) for c in candidates if normalize_header(c)
-        ]
-        if not normalized_candidates:
-            return None
-
-        available_norms = list(available.keys())
-        best_header: str | None = None
-        best_score: float = 0.0
-
-        for candidate in normalized_candidates:
-            for scorer in (fuzz.token_sort_ratio, fuzz.partial_ratio):
-                result = process.extractOne(
-                    candidate,
-                    available_norms,
+        flat_candidates: list[str] = []
+        spans: dict[str, tuple[int, int]] = {}
+        for canonical_field, candidates in candidates_by_field.items():
+            start = len(flat_candidates)
+            flat_candidates.extend(norm for norm in map(normalize_header, candidates) if norm)
+            spans[canonical_field] = (start, len(flat_candidates))
+        if not flat_candidates or not header_norms:
+            return {}
+
+        scores = np.maximum(
+            *(
+                process.cdist(
+                    flat_candidates,
+                    header_norms,
                     scorer=scorer,
                     score_cutoff=self._fuzzy_threshold,
+                    workers=self._fuzzy_workers,
                 )
-                if result is not None:
-                    match_norm, score, _ = result
-                    if score > best_score:
-                        best_score = score
-                        best_header = available[match_norm]
+                for scorer in (fuzz.token_sort_ratio, fuzz.partial_ratio)
+            )
+        )
+        return {
+            canonical_field: scores[start:end].max(axis=0)
+            for canonical_field, (start, end) in spans.items()
+            if end > start
+        }
 
-        return best_header
+    def _find_best_fuzzy_match(
+        self,
+        *,
+        header_scores: np.ndarray | None,
+        header_sources: Sequence[str],
+        used_headers: set[str],
+    ) -> str | None:
+        """Pick the best-scoring header not already claimed by another field."""
+        if header_scores is None:
+            return None
+        available = np.where(
+            [source in used_headers for source in header_sources], 0.0, header_scores
+        )
+        best_index = int(available.argmax())
+        best_score = float(available[best_index])
+        if best_score <= 0.0 or best_score < self._fuzzy_threshold:
+            return None
+        return header_sources[best_index]
 
     # ------------------------------------------------------------------
     # Override / config helpers
@@ -353,20 +475,25 @@ class SchemaMapper:
         mapping_config: Any | None,
         manual_overrides: Mapping[str, str] | None,
     ) -> dict[str, str]:
+        config_mapping = getattr(mapping_config, "field_mapping_json", None)
         merged: dict[str, str] = {}
-
-        if mapping_config is not None:
-            config_mapping = getattr(mapping_config, "field_mapping_json", None)
-            if isinstance(config_mapping, dict):
-                for key, value in config_mapping.items():
-                    if isinstance(key, str) and isinstance(value, str):
-                        if key.strip() and value.strip():
-                            merged[key.strip()] = value.strip()
-
+        if isinstance(config_mapping, dict):
+            merged = {
+                clean_key: clean_value
+                for key, value in config_mapping.items()
+                if isinstance(key, str)
+                and isinstance(value, str)
+                and (clean_key := key.strip())
+                and (clean_value := value.strip())
+            }
+
+        # Manual overrides win over the stored config.
         if manual_overrides:
-            for key, value in manual_overrides.items():
-                if key.strip() and value.strip():
-                    merged[key.strip()] = value.strip()
+            merged.update(
+                (clean_key, clean_value)
+                for key, value in manual_overrides.items()
+                if (clean_key := key.strip()) and (clean_value := value.strip())
+            )
 
         return merged
 
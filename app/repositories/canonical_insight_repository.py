@@ -6,7 +6,8 @@ Persistence layer for canonical insight records.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
 from typing import Any
 
 from sqlalchemy.dialects.postgresql import insert
@@ -40,7 +41,8 @@ class CanonicalInsightRepository:
         if not rows:
             return 0
 
-        payloads: list[dict[str, Any]] = [
+        # Payload dicts are built lazily, one insert chunk at a time.
+        payloads = (
             {
                 "source_type": row.source_type,
                 "entity_name": row.entity_name,
@@ -53,7 +55,7 @@ class CanonicalInsightRepository:
                 "metadata_json": row.metadata_json,
             }
             for row in rows
-        ]
+        )
         return self._bulk_insert_payloads(payloads, batch_size=batch_size)
 
     def bulk_insert_atomic(
@@ -85,23 +87,7 @@ class CanonicalInsightRepository:
         if not rows:
             return 0
 
-        payloads: list[dict[str, Any]] = []
-        for row in rows:
-            payload: dict[str, Any] = {
-                "source_type": row.source_type,
-                "entity_name": row.entity_name,
-                "category": row.category,
-                "role": row.role,
-                "metric_name": row.metric_name,
-                "metric_value": row.metric_value,
-                "timestamp": row.timestamp,
-                "region": row.region,
-                "metadata_json": row.metadata_json,
-            }
-            if row.id is not None:
-                payload["id"] = row.id
-            payloads.append(payload)
-
+        payloads = (self._model_payload(row) for row in rows)
         return self._bulk_insert_payloads(payloads, batch_size=batch_size)
 
     def bulk_insert_models_atomic(
@@ -120,9 +106,26 @@ class CanonicalInsightRepository:
         with self._transaction_context():
             return self.bulk_insert_models(rows, batch_size=batch_size)
 
+    @staticmethod
+    def _model_payload(row: CanonicalInsightRecord) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "source_type": row.source_type,
+            "entity_name": row.entity_name,
+            "category": row.category,
+            "role": row.role,
+            "metric_name": row.metric_name,
+            "metric_value": row.metric_value,
+            "timestamp": row.timestamp,
+            "region": row.region,
+            "metadata_json": row.metadata_json,
+        }
+        if row.id is not None:
+            payload["id"] = row.id
+        return payload
+
     def _bulk_insert_payloads(
         self,
-        payloads: Sequence[dict[str, Any]],
+        payloads: Iterable[dict[str, Any]],
         *,
         batch_size: int,
     ) -> int:
@@ -130,25 +133,33 @@ class CanonicalInsightRepository:
         deduped_payloads = self._deduplicate_payloads(payloads)
         inserted = 0
 
-        for start in range(0, len(deduped_payloads), size):
-            chunk = deduped_payloads[start : start + size]
-            stmt = (
-                insert(CanonicalInsightRecord)
-                .values(chunk)
-                .on_conflict_do_nothing(constraint=_DEDUPE_CONSTRAINT)
-                .returning(CanonicalInsightRecord.id)
+        # One parameterless statement executed with a list of parameter sets:
+        # SQLAlchemy's insertmanyvalues batches each chunk into a single
+        # multi-row INSERT ... RETURNING round trip while the compiled form is
+        # cached, instead of re-building a ``.values(chunk)`` statement with
+        # thousands of inline bind parameters per chunk.
+        stmt = (
+            insert(CanonicalInsightRecord)
+            .on_conflict_do_nothing(constraint=_DEDUPE_CONSTRAINT)
+            .returning(CanonicalInsightRecord.id)
+        )
+        while chunk := list(islice(deduped_payloads, size)):
+            inserted += len(
+                self._session.scalars(
+                    stmt,
+                    chunk,
+                    execution_options={"insertmanyvalues_page_size": size},
+                ).all()
             )
-            inserted += len(self._session.scalars(stmt).all())
 
         return inserted
 
+    @staticmethod
     def _deduplicate_payloads(
-        self,
-        payloads: Sequence[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
+        payloads: Iterable[dict[str, Any]],
+    ) -> Iterator[dict[str, Any]]:
+        # First payload per key wins; only the keys are kept across chunks.
         seen: set[tuple[str, str, str, str, Any]] = set()
-        deduped_payloads: list[dict[str, Any]] = []
-
         for payload in payloads:
             key = (
                 payload["source_type"],
@@ -157,12 +168,9 @@ class CanonicalInsightRepository:
                 payload["metric_name"],
                 payload["timestamp"],
             )
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped_payloads.append(payload)
-
-        return deduped_payloads
+            if key not in seen:
+                seen.add(key)
+                yield payload
 
     def _transaction_context(self) -> Any:
         if self._session.in_transaction():
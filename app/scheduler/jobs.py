@@ -15,9 +15,11 @@ Entities are resolved at job runtime from two sources, merged and deduplicated:
 
 Schedule (all times UTC)
 --------------------------
-  daily_kpi          — 02:00 every day
-  daily_forecast     — 02:30 every day
-  daily_risk         — 03:00 every day
+  daily_pipeline     — 02:00 every day
+
+The daily pipeline runs KPI → forecast → risk per entity in one pass.  The
+single-stage jobs (``run_daily_kpi``, ``run_daily_forecast``,
+``run_daily_risk``) are kept for on-demand runs.
 
 Lifecycle
 ----------
@@ -30,14 +32,18 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Callable, Collection
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Iterator
+from functools import lru_cache, partial
+from typing import Any, Iterator
 
 from dateutil.relativedelta import relativedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.orm import Session
 
 from llm_synthesis.schema import FinalInsightResponse
@@ -46,7 +52,7 @@ from app.services.category_registry import (
     primary_metric_for_business_type,
     supported_categories,
 )
-from app.services.kpi_orchestrator import KPIOrchestrator, KPIRunResult
+from app.services.kpi_orchestrator import KPIRunResult, get_kpi_orchestrator
 from db.models.client import Client
 from db.models.computed_kpi import ComputedKPI
 from db.session import SessionLocal
@@ -142,9 +148,15 @@ def _entities_from_env() -> list[tuple[str, str]]:
     Format: ``name:type,name:type``  (whitespace-tolerant, case-insensitive type).
     Invalid or unknown business types are skipped with a WARNING log.
     """
-    raw = os.getenv("SCHEDULER_ENTITIES", "").strip()
+    return list(_parse_env_entities(os.getenv("SCHEDULER_ENTITIES", "").strip()))
+
+
+@lru_cache(maxsize=4)
+def _parse_env_entities(raw: str) -> tuple[tuple[str, str], ...]:
+    # Keyed on the raw value: parsed (and warned about) once per distinct
+    # setting instead of on every job run, while env changes still apply.
     if not raw:
-        return []
+        return ()
     valid_business_types = _valid_business_types()
     entities: list[tuple[str, str]] = []
     for token in raw.split(","):
@@ -165,26 +177,30 @@ def _entities_from_env() -> list[tuple[str, str]]:
             )
             continue
         entities.append((name, btype))
-    return entities
+    return tuple(entities)
 
 
-def _entities_from_db(session: Session) -> list[tuple[str, str]]:
+def _entities_from_db(
+    session: Session,
+    *,
+    exclude_names: Collection[str] = (),
+) -> list[tuple[str, str]]:
     """
     Query active ``Client`` rows whose ``config`` JSONB has a valid
-    ``"business_type"`` key.  Returns (client.name, business_type) pairs.
+    ``"business_type"`` key.  Returns (client.name, business_type) pairs,
+    skipping any client named in ``exclude_names``.
     """
     try:
-        valid_business_types = list(_valid_business_types())
-        rows = (
-            session.query(Client.name, Client.config)
-            .filter(
-                Client.is_active.is_(True),
-                Client.config.isnot(None),
-                Client.config["business_type"].astext.in_(valid_business_types),
-            )
-            .all()
+        business_type = Client.config["business_type"].astext
+        # Only the one JSONB key is fetched, never the whole config blob.
+        stmt = select(Client.name, business_type).where(
+            Client.is_active.is_(True),
+            business_type.in_(tuple(sorted(_valid_business_types()))),
         )
-        return [(row.name, row.config["business_type"]) for row in rows]
+        if exclude_names:
+            stmt = stmt.where(Client.name.not_in(tuple(sorted(exclude_names))))
+        rows = session.execute(stmt.execution_options(yield_per=500))
+        return [(name, btype) for name, btype in rows]
     except Exception as exc:  # noqa: BLE001
         logger.warning("Entity discovery from DB failed: %s", exc)
         return []
@@ -195,15 +211,12 @@ def _resolve_entities(session: Session) -> list[tuple[str, str]]:
     Merge env-var entities and DB entities; env-var entries take precedence
     for duplicate names.  Returns deduplicated (entity_name, business_type) list.
     """
-    env_entities = _entities_from_env()
-    db_entities = _entities_from_db(session)
-
-    # Env-var wins on name collision.
-    merged: dict[str, str] = {name: btype for name, btype in db_entities}
-    for name, btype in env_entities:
-        merged[name] = btype
+    # Env-var wins on name collision: those names are filtered out in SQL
+    # so their client rows are never fetched only to be overwritten.
+    env_entities = dict(_entities_from_env())
+    db_entities = _entities_from_db(session, exclude_names=env_entities.keys())
 
-    return list(merged.items())
+    return db_entities + list(env_entities.items())
 
 
 # ---------------------------------------------------------------------------
@@ -221,226 +234,406 @@ def _session_scope() -> Iterator[Session]:
         session.close()
 
 
+def _scheduler_workers() -> int:
+    """
+    Entity fan-out width from ``SCHEDULER_MAX_WORKERS``; defaults to the CPU
+    count capped at 4 so the jobs stay inside the default DB pool.
+    """
+    default = min(4, os.cpu_count() or 1)
+    try:
+        return max(1, int(os.getenv("SCHEDULER_MAX_WORKERS", default)))
+    except ValueError:
+        return default
+
+
+def _for_each_entity(
+    entities: list[tuple[str, str]],
+    work: Callable[[str, str], None],
+) -> list[Exception]:
+    """
+    Run ``work(entity_name, business_type)`` for every entity on a thread pool
+    and return the exceptions raised, in entity order.
+
+    Each call opens its own session, so entities commit independently.  The
+    orchestrators spend most of their time in the database and in numpy, both
+    of which release the GIL; a process pool would have to fork the API
+    process (and its engine sockets) from the scheduler thread.  A failing
+    entity never stops the others.
+    """
+    with ThreadPoolExecutor(
+        max_workers=min(_scheduler_workers(), len(entities)),
+        thread_name_prefix="scheduler-entity",
+    ) as executor:
+        futures = [executor.submit(work, name, btype) for name, btype in entities]
+    return [exc for future in futures if (exc := future.exception()) is not None]
+
+
 # ---------------------------------------------------------------------------
-# Job: Daily KPI recomputation
+# Per-entity stages
 # ---------------------------------------------------------------------------
 
 
-def run_daily_kpi() -> FinalInsightResponse:
+def _run_kpi_windows(
+    db: Session,
+    entity_name: str,
+    business_type: str,
+    monthly_windows: list[tuple[datetime, datetime]],
+) -> list[KPIRunResult]:
+    """Recompute each monthly KPI window; failed windows are logged and skipped."""
+    orchestrator = get_kpi_orchestrator()
+    results: list[KPIRunResult] = []
+    for win_start, win_end in monthly_windows:
+        try:
+            results.append(
+                orchestrator.run(
+                    entity_name=entity_name,
+                    business_type=business_type,
+                    period_start=win_start,
+                    period_end=win_end,
+                    db=db,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Scheduler: KPI window failed entity=%r window=[%s, %s]: %s",
+                entity_name, win_start.isoformat(), win_end.isoformat(), exc,
+            )
+    logger.debug(
+        "Scheduler: KPI entity=%r business_type=%r windows=%d succeeded=%d",
+        entity_name, business_type, len(monthly_windows), len(results),
+    )
+    return results
+
+
+def _update_forecast(
+    db: Session,
+    entity_name: str,
+    metric_name: str,
+    kpi_results: list[KPIRunResult],
+) -> dict | None:
     """
-    Recompute KPIs for all known entities using per-month windows so that
-    downstream nodes receive a proper time-series instead of a single aggregate.
-    KPIOrchestrator commits internally; no explicit commit is needed here.
+    Forecast the primary metric from the monthly KPI results.  Returns the
+    stored forecast payload, or None when deferred or failed (rolled back).
     """
     try:
-        logger.info("Scheduler: daily_kpi starting")
-        now = datetime.now(tz=timezone.utc)
-        period_start = now - timedelta(days=90)
-        monthly_windows = _generate_monthly_windows(period_start, now)
+        values: list[float] = []
+        for kpi_result in kpi_results:
+            values.extend(_extract_primary_metric_values(kpi_result, metric_name))
+
+        result = ForecastOrchestrator(db).generate_forecast(
+            entity_name=entity_name,
+            metric_name=metric_name,
+            values=values,
+        )
+        if "error" in result:
+            logger.info(
+                "Scheduler: forecast deferred entity=%r: %s",
+                entity_name,
+                result["error"],
+            )
+            return None
+        db.commit()
+        logger.debug(
+            "Scheduler: forecast entity=%r trend=%s points=%d",
+            entity_name,
+            result.get("trend"),
+            len(values),
+        )
+        return result
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        logger.warning("Scheduler: forecast failed entity=%r: %s", entity_name, exc)
+        return None
 
-        with _session_scope() as db:
-            entities = _resolve_entities(db)
-            if not entities:
-                logger.warning("Scheduler: daily_kpi — no entities found, skipping")
-                return _job_success("daily_kpi")
-
-            orchestrator = KPIOrchestrator()
-            for entity_name, business_type in entities:
-                succeeded = 0
-                for win_start, win_end in monthly_windows:
-                    try:
-                        orchestrator.run(
-                            entity_name=entity_name,
-                            business_type=business_type,
-                            period_start=win_start,
-                            period_end=win_end,
-                            db=db,
-                        )
-                        succeeded += 1
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning(
-                            "Scheduler: daily_kpi failed entity=%r window=[%s, %s]: %s",
-                            entity_name, win_start.isoformat(), win_end.isoformat(), exc,
-                        )
-                logger.info(
-                    "Scheduler: daily_kpi entity=%r business_type=%r windows=%d succeeded=%d",
-                    entity_name, business_type, len(monthly_windows), succeeded,
-                )
 
-        logger.info("Scheduler: daily_kpi complete")
-        return _job_success("daily_kpi")
-    except Exception as exc:  # noqa: BLE001
-        return _job_failure("daily_kpi", exc)
+# Built once; SQLAlchemy's compiled cache then serves every entity's lookup.
+_LATEST_KPI_STMT = (
+    select(ComputedKPI.computed_kpis)
+    .where(ComputedKPI.entity_name == bindparam("entity_name"))
+    .order_by(ComputedKPI.period_end.desc())
+    .limit(1)
+)
 
 
-# ---------------------------------------------------------------------------
-# Job: Daily forecast update
-# ---------------------------------------------------------------------------
+def _latest_kpi_metrics(db: Session, entity_name: str) -> dict:
+    """``computed_kpis`` JSONB of the entity's most recent ComputedKPI row."""
+    # Only the JSONB column is fetched; no ComputedKPI instance is built.
+    row = db.execute(_LATEST_KPI_STMT, {"entity_name": entity_name}).first()
+    if row is None:
+        raise ValueError(
+            f"No KPI data found for entity={entity_name!r}; cannot compute risk."
+        )
+    return row.computed_kpis or {}
 
 
-def run_daily_forecast() -> FinalInsightResponse:
+def _latest_forecast_data(db: Session, entity_name: str, metric_name: str) -> dict:
+    """Payload of the most recent stored forecast for the primary metric."""
+    forecast_record = ForecastRepository(db).get_latest_forecast(
+        entity_name=entity_name,
+        metric_name=metric_name,
+    )
+    if forecast_record is None:
+        raise ValueError(
+            f"No forecast data found for entity={entity_name!r} "
+            f"metric={metric_name!r}; cannot compute risk."
+        )
+    return forecast_record.forecast_data or {}
+
+
+def _update_risk(
+    db: Session,
+    entity_name: str,
+    business_type: str,
+    *,
+    raw_kpis: dict | None = None,
+    forecast_data: dict | None = None,
+) -> None:
     """
-    Regenerate forecasts for all known entities using the primary KPI metric.
-    Collects per-month KPI values to feed the forecast with a proper time-series.
-    Commits per entity on success; rolls back on failure.
+    Score risk from KPI metrics and forecast payload, loading whichever is not
+    supplied from the latest stored rows.  Failures roll back, are logged and
+    re-raised.
     """
     try:
-        logger.info("Scheduler: daily_forecast starting")
-        now = datetime.now(tz=timezone.utc)
-        period_start = now - timedelta(days=90)
-        monthly_windows = _generate_monthly_windows(period_start, now)
+        metric_name = primary_metric_for_business_type(business_type)
+        if raw_kpis is None:
+            raw_kpis = _latest_kpi_metrics(db, entity_name)
+        if forecast_data is None:
+            forecast_data = _latest_forecast_data(db, entity_name, metric_name)
+
+        # Map the computed_kpis JSONB to the flat kpi_data dict.
+        # JSONB shape: {"metric_key": {"value": float | None, "unit": str, ...}}
+        def _kpi_value(key: str) -> float:
+            entry = raw_kpis.get(key) or {}
+            v = entry.get("value")
+            return float(v) if v is not None else 0.0
+
+        churn_key = churn_metric_for_business_type(business_type)
+        kpi_data: dict = {
+            "revenue_growth_delta": _kpi_value("growth_rate"),
+            "churn_delta":          _kpi_value(churn_key),
+            "conversion_delta":     _kpi_value("conversion_rate"),
+        }
+
+        # forecast_data is the full payload stored by ForecastOrchestrator.
+        # It already contains slope, deviation_percentage, and churn_acceleration.
+        result = RiskOrchestrator(db).generate_risk_score(
+            entity_name=entity_name,
+            kpi_data=kpi_data,
+            forecast_data=forecast_data,
+        )
+        db.commit()
+        logger.debug(
+            "Scheduler: risk entity=%r score=%s level=%s",
+            entity_name,
+            result.get("risk_score"),
+            result.get("risk_level"),
+        )
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        logger.error(
+            "Scheduler: daily_risk critical failure entity=%r: %s",
+            entity_name,
+            exc,
+            extra={
+                "event": "scheduler_daily_risk_critical_failure",
+                "entity_name": entity_name,
+            },
+            exc_info=True,
+        )
+        raise
+
+
+def _pipeline_one(
+    entity_name: str,
+    business_type: str,
+    monthly_windows: list[tuple[datetime, datetime]],
+) -> None:
+    """
+    KPI → forecast → risk for one entity on one session, handing each stage's
+    in-memory result to the next instead of re-running or re-reading it.
+    """
+    metric_name = primary_metric_for_business_type(business_type)
+    with _session_scope() as db:
+        kpi_results = _run_kpi_windows(db, entity_name, business_type, monthly_windows)
+        forecast_data = _update_forecast(db, entity_name, metric_name, kpi_results)
+        # A failed/deferred stage falls back to the latest stored row, as the
+        # standalone risk job does.
+        _update_risk(
+            db,
+            entity_name,
+            business_type,
+            raw_kpis=kpi_results[-1].metrics if kpi_results else None,
+            forecast_data=forecast_data,
+        )
+
 
+def _kpi_one(
+    entity_name: str,
+    business_type: str,
+    monthly_windows: list[tuple[datetime, datetime]],
+) -> None:
+    with _session_scope() as db:
+        _run_kpi_windows(db, entity_name, business_type, monthly_windows)
+
+
+def _forecast_one(
+    entity_name: str,
+    business_type: str,
+    monthly_windows: list[tuple[datetime, datetime]],
+) -> None:
+    metric_name = primary_metric_for_business_type(business_type)
+    with _session_scope() as db:
+        kpi_results = _run_kpi_windows(db, entity_name, business_type, monthly_windows)
+        _update_forecast(db, entity_name, metric_name, kpi_results)
+
+
+def _prefetch_risk_inputs(
+    db: Session,
+    entities: list[tuple[str, str]],
+) -> dict[str, dict]:
+    """
+    Latest KPI metrics per entity and latest forecast per (entity, primary
+    metric), each fetched for every entity in one ``DISTINCT ON`` query.
+
+    Only the KPI values risk scoring reads are extracted, server-side with
+    JSONB path operators, so the full ``computed_kpis`` payload never leaves
+    Postgres.  They come back in the stored ``{"key": {"value": ...}}`` shape.
+    """
+    names = [name for name, _ in entities]
+    kpi_keys = sorted(
+        {"growth_rate", "conversion_rate"}
+        | {churn_metric_for_business_type(btype) for _, btype in entities}
+    )
+    kpi_rows = db.execute(
+        select(
+            ComputedKPI.entity_name,
+            *(ComputedKPI.computed_kpis[(key, "value")].astext for key in kpi_keys),
+        )
+        .ext(distinct_on(ComputedKPI.entity_name))
+        .where(ComputedKPI.entity_name.in_(names))
+        .order_by(ComputedKPI.entity_name, ComputedKPI.period_end.desc())
+    )
+    forecasts = ForecastRepository(db).get_latest_forecasts_bulk(
+        (name, primary_metric_for_business_type(btype)) for name, btype in entities
+    )
+    return {
+        "latest_kpis": {
+            entity_name: {key: {"value": value} for key, value in zip(kpi_keys, values)}
+            for entity_name, *values in kpi_rows
+        },
+        "latest_forecasts": {
+            key: record.forecast_data or {} for key, record in forecasts.items()
+        },
+    }
+
+
+def _risk_one(
+    entity_name: str,
+    business_type: str,
+    *,
+    latest_kpis: dict[str, dict],
+    latest_forecasts: dict[tuple[str, str], dict],
+) -> None:
+    metric_name = primary_metric_for_business_type(business_type)
+    with _session_scope() as db:
+        # Entities missing from the prefetch fall back to the single-row
+        # lookups, which raise the descriptive "no data" errors.
+        _update_risk(
+            db,
+            entity_name,
+            business_type,
+            raw_kpis=latest_kpis.get(entity_name),
+            forecast_data=latest_forecasts.get((entity_name, metric_name)),
+        )
+
+
+def _run_stage(
+    stage_name: str,
+    work: Callable[..., None],
+    *,
+    prefetch: Callable[[Session, list[tuple[str, str]]], dict[str, Any]] | None = None,
+) -> FinalInsightResponse:
+    """
+    Resolve entities once and run ``work`` for each of them.  ``prefetch``
+    loads shared inputs for all entities on the same session; its result is
+    passed to ``work`` as keyword arguments.
+    """
+    try:
+        logger.info("Scheduler: %s starting", stage_name)
         with _session_scope() as db:
             entities = _resolve_entities(db)
-            if not entities:
-                logger.warning("Scheduler: daily_forecast — no entities found, skipping")
-                return _job_success("daily_forecast")
-
-            orchestrator = KPIOrchestrator()
-            for entity_name, business_type in entities:
-                try:
-                    metric_name = primary_metric_for_business_type(business_type)
-                    values: list[float] = []
-                    for win_start, win_end in monthly_windows:
-                        try:
-                            kpi_result = orchestrator.run(
-                                entity_name=entity_name,
-                                business_type=business_type,
-                                period_start=win_start,
-                                period_end=win_end,
-                                db=db,
-                            )
-                            for v in _extract_primary_metric_values(kpi_result, metric_name):
-                                values.append(v)
-                        except Exception:  # noqa: BLE001
-                            pass  # window-level failure is non-fatal
-
-                    result = ForecastOrchestrator(db).generate_forecast(
-                        entity_name=entity_name,
-                        metric_name=metric_name,
-                        values=values,
-                    )
-                    if "error" in result:
-                        logger.info(
-                            "Scheduler: daily_forecast deferred entity=%r: %s",
-                            entity_name,
-                            result["error"],
-                        )
-                    else:
-                        db.commit()
-                        logger.info(
-                            "Scheduler: daily_forecast entity=%r trend=%s points=%d",
-                            entity_name,
-                            result.get("trend"),
-                            len(values),
-                        )
-                except Exception as exc:  # noqa: BLE001
-                    db.rollback()
-                    logger.warning(
-                        "Scheduler: daily_forecast failed entity=%r: %s", entity_name, exc
-                    )
-
-        logger.info("Scheduler: daily_forecast complete")
-        return _job_success("daily_forecast")
+            if entities and prefetch is not None:
+                work = partial(work, **prefetch(db, entities))
+        if not entities:
+            logger.warning("Scheduler: %s — no entities found, skipping", stage_name)
+            return _job_success(stage_name)
+
+        errors = _for_each_entity(entities, work)
+
+        # One summary record per run; per-entity successes log at DEBUG.
+        logger.info(
+            "Scheduler: %s complete entities=%d failed=%d",
+            stage_name, len(entities), len(errors),
+        )
+        if errors:
+            raise errors[0]
+        return _job_success(stage_name)
     except Exception as exc:  # noqa: BLE001
-        return _job_failure("daily_forecast", exc)
+        return _job_failure(stage_name, exc)
+
+
+def _recompute_windows() -> list[tuple[datetime, datetime]]:
+    now = datetime.now(tz=timezone.utc)
+    return _generate_monthly_windows(now - timedelta(days=90), now)
 
 
 # ---------------------------------------------------------------------------
-# Job: Daily risk update
+# Jobs
 # ---------------------------------------------------------------------------
 
 
-def run_daily_risk() -> FinalInsightResponse:
+def run_daily_pipeline() -> FinalInsightResponse:
+    """
+    Scheduled daily job: KPI → forecast → risk in one pass per entity.
+
+    Each entity's KPI windows are computed once and fed straight into the
+    forecast, and the KPI result and forecast payload go straight into risk
+    scoring, so neither the KPI run nor the latest-row lookups are repeated.
+    Entities run concurrently, each on its own session.
     """
-    Recompute risk scores for all known entities.
+    return _run_stage(
+        "daily_pipeline",
+        partial(_pipeline_one, monthly_windows=_recompute_windows()),
+    )
+
+
+def run_daily_kpi() -> FinalInsightResponse:
+    """
+    Recompute KPIs for all known entities using per-month windows so that
+    downstream nodes receive a proper time-series instead of a single aggregate.
+    KPIOrchestrator commits internally; no explicit commit is needed here.
+    """
+    return _run_stage("daily_kpi", partial(_kpi_one, monthly_windows=_recompute_windows()))
+
+
+def run_daily_forecast() -> FinalInsightResponse:
+    """
+    Regenerate forecasts for all known entities using the primary KPI metric.
+    Collects per-month KPI values to feed the forecast with a proper time-series.
     Commits per entity on success; rolls back on failure.
     """
-    try:
-        logger.info("Scheduler: daily_risk starting")
+    return _run_stage(
+        "daily_forecast",
+        partial(_forecast_one, monthly_windows=_recompute_windows()),
+    )
 
-        with _session_scope() as db:
-            entities = _resolve_entities(db)
-            if not entities:
-                logger.warning("Scheduler: daily_risk — no entities found, skipping")
-                return _job_success("daily_risk")
-
-            for entity_name, business_type in entities:
-                try:
-                    # Fetch the most recent ComputedKPI row for this entity.
-                    kpi_record = db.scalars(
-                        select(ComputedKPI)
-                        .where(ComputedKPI.entity_name == entity_name)
-                        .order_by(ComputedKPI.period_end.desc())
-                        .limit(1)
-                    ).first()
-                    if kpi_record is None:
-                        raise ValueError(
-                            f"No KPI data found for entity={entity_name!r}; cannot compute risk."
-                        )
-
-                    # Fetch the most recent forecast for the primary metric.
-                    metric_name = primary_metric_for_business_type(business_type)
-                    forecast_record = ForecastRepository(db).get_latest_forecast(
-                        entity_name=entity_name,
-                        metric_name=metric_name,
-                    )
-                    if forecast_record is None:
-                        raise ValueError(
-                            f"No forecast data found for entity={entity_name!r} "
-                            f"metric={metric_name!r}; cannot compute risk."
-                        )
-
-                    # Map the stored computed_kpis JSONB to the flat kpi_data dict.
-                    # JSONB shape: {"metric_key": {"value": float | None, "unit": str, ...}}
-                    raw_kpis: dict = kpi_record.computed_kpis or {}
-
-                    def _kpi_value(key: str) -> float:
-                        entry = raw_kpis.get(key) or {}
-                        v = entry.get("value")
-                        return float(v) if v is not None else 0.0
-
-                    churn_key = churn_metric_for_business_type(business_type)
-                    kpi_data: dict = {
-                        "revenue_growth_delta": _kpi_value("growth_rate"),
-                        "churn_delta":          _kpi_value(churn_key),
-                        "conversion_delta":     _kpi_value("conversion_rate"),
-                    }
-
-                    # forecast_data is the full JSONB payload stored by ForecastOrchestrator.
-                    # It already contains slope, deviation_percentage, and churn_acceleration.
-                    forecast_data: dict = forecast_record.forecast_data or {}
-
-                    result = RiskOrchestrator(db).generate_risk_score(
-                        entity_name=entity_name,
-                        kpi_data=kpi_data,
-                        forecast_data=forecast_data,
-                    )
-                    db.commit()
-                    logger.info(
-                        "Scheduler: daily_risk entity=%r score=%s level=%s",
-                        entity_name,
-                        result.get("risk_score"),
-                        result.get("risk_level"),
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    db.rollback()
-                    logger.error(
-                        "Scheduler: daily_risk critical failure entity=%r: %s",
-                        entity_name,
-                        exc,
-                        extra={
-                            "event": "scheduler_daily_risk_critical_failure",
-                            "entity_name": entity_name,
-                        },
-                        exc_info=True,
-                    )
-                    raise
-
-        logger.info("Scheduler: daily_risk complete")
-        return _job_success("daily_risk")
-    except Exception as exc:  # noqa: BLE001
-        return _job_failure("daily_risk", exc)
+
+def run_daily_risk() -> FinalInsightResponse:
+    """
+    Recompute risk scores for all known entities from their latest stored KPI
+    and forecast rows.  Commits per entity on success; rolls back on failure.
+    """
+    return _run_stage("daily_risk", _risk_one, prefetch=_prefetch_risk_inputs)
 
 
 # ---------------------------------------------------------------------------
@@ -448,6 +641,12 @@ def run_daily_risk() -> FinalInsightResponse:
 # ---------------------------------------------------------------------------
 
 
+# (job id, callable, hour UTC, minute, display name)
+_SCHEDULED_JOBS: tuple[tuple[str, Callable[[], FinalInsightResponse], int, int, str], ...] = (
+    ("daily_pipeline", run_daily_pipeline, 2, 0, "Daily KPI, forecast and risk recomputation"),
+)
+
+
 def build_scheduler() -> BackgroundScheduler:
     """
     Build and register all periodic jobs.
@@ -457,40 +656,26 @@ def build_scheduler() -> BackgroundScheduler:
     appropriate lifecycle points.
 
     Schedule (UTC):
-        daily_kpi           — 02:00 every day
-        daily_forecast      — 02:30 every day
-        daily_risk          — 03:00 every day
+        daily_pipeline      — 02:00 every day (KPI → forecast → risk)
+
+    ``run_daily_kpi`` / ``run_daily_forecast`` / ``run_daily_risk`` remain
+    available for running a single stage on demand.
     """
     scheduler = BackgroundScheduler(timezone="UTC")
 
-    scheduler.add_job(
-        run_daily_kpi,
-        trigger="cron",
-        hour=2,
-        minute=0,
-        id="daily_kpi",
-        name="Daily KPI recomputation",
-        replace_existing=True,
-        misfire_grace_time=3600,
-    )
-    scheduler.add_job(
-        run_daily_forecast,
-        trigger="cron",
-        hour=2,
-        minute=30,
-        id="daily_forecast",
-        name="Daily forecast update",
-        replace_existing=True,
-        misfire_grace_time=3600,
-    )
-    scheduler.add_job(
-        run_daily_risk,
-        trigger="cron",
-        hour=3,
-        minute=0,
-        id="daily_risk",
-        name="Daily risk scoring",
-        replace_existing=True,
-        misfire_grace_time=3600,
-    )
+    for job_id, func, hour, minute, name in _SCHEDULED_JOBS:
+        scheduler.add_job(
+            func,
+            trigger="cron",
+            hour=hour,
+            minute=minute,
+            id=job_id,
+            name=name,
+            replace_existing=True,
+            misfire_grace_time=3600,
+            # Runs missed during downtime collapse into one, and a run still
+            # in progress is never joined by a second one.
+            coalesce=True,
+            max_instances=1,
+        )
     return scheduler
@@ -6,7 +6,7 @@ Response schemas for competitor scraping operations.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CompetitorScrapeSummaryResponse(BaseModel):
@@ -14,6 +14,8 @@ class CompetitorScrapeSummaryResponse(BaseModel):
     API response model for one competitor scrape summary.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     competitor: str
     records_scraped: int = Field(..., ge=0)
     records_inserted: int = Field(..., ge=0)
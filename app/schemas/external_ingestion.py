@@ -6,7 +6,7 @@ Response schemas for external ingestion operations.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExternalIngestionSummaryResponse(BaseModel):
@@ -14,6 +14,8 @@ class ExternalIngestionSummaryResponse(BaseModel):
     API response model for one source ingestion summary.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     source: str
     records_inserted: int = Field(..., ge=0)
     failed_records: int = Field(..., ge=0)
@@ -8,18 +8,23 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
 class IngestionJobAcceptedResponse(BaseModel):
-    job_id: UUID
+    model_config = ConfigDict(from_attributes=True)
+
+    # ``IngestionJob.id`` on the ORM row, ``job_id`` on the wire.
+    job_id: UUID = Field(validation_alias=AliasChoices("job_id", "id"))
     job_type: str
     status: str
     created_at: datetime
 
 
 class IngestionJobStatusResponse(BaseModel):
-    job_id: UUID
+    model_config = ConfigDict(from_attributes=True)
+
+    job_id: UUID = Field(validation_alias=AliasChoices("job_id", "id"))
     job_type: str
     status: str
     created_at: datetime
@@ -31,5 +36,14 @@ class IngestionJobStatusResponse(BaseModel):
     error_message: str | None = None
 
 
+class IngestionStatusCursor(BaseModel):
+    before_created_at: datetime
+    before_id: UUID
+
+
 class IngestionStatusListResponse(BaseModel):
     jobs: list[IngestionJobStatusResponse] = Field(default_factory=list)
+    next_before: IngestionStatusCursor | None = Field(
+        default=None,
+        description="Pass as before_created_at/before_id to fetch the next page; null on the last page.",
+    )
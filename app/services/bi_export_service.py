@@ -31,7 +31,7 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from typing import Any, Iterator
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from db.models.canonical_insight_record import CanonicalInsightRecord
@@ -43,6 +43,46 @@ from risk.repository import BusinessRiskScore
 _VALID_DATASETS: frozenset[str] = frozenset({"records", "kpis", "forecasts", "risk"})
 _MAX_LIMIT: int = 100_000
 
+# Exported columns per dataset.  Handlers select these directly and flatten
+# the returned Core rows, so no ORM entities (identity map, change tracking,
+# unexported columns) are materialised for an export.
+_RECORD_COLUMNS = (
+    CanonicalInsightRecord.id,
+    CanonicalInsightRecord.source_type,
+    CanonicalInsightRecord.entity_name,
+    CanonicalInsightRecord.category,
+    CanonicalInsightRecord.metric_name,
+    CanonicalInsightRecord.metric_value,
+    CanonicalInsightRecord.timestamp,
+    CanonicalInsightRecord.region,
+    CanonicalInsightRecord.metadata_json,
+    CanonicalInsightRecord.created_at,
+)
+_KPI_COLUMNS = (
+    ComputedKPI.id,
+    ComputedKPI.entity_name,
+    ComputedKPI.period_start,
+    ComputedKPI.period_end,
+    ComputedKPI.computed_kpis,
+    ComputedKPI.created_at,
+)
+_FORECAST_COLUMNS = (
+    ForecastMetric.id,
+    ForecastMetric.entity_name,
+    ForecastMetric.metric_name,
+    ForecastMetric.period_end,
+    ForecastMetric.forecast_data,
+    ForecastMetric.created_at,
+)
+_RISK_COLUMNS = (
+    BusinessRiskScore.id,
+    BusinessRiskScore.entity_name,
+    BusinessRiskScore.period_end,
+    BusinessRiskScore.risk_score,
+    BusinessRiskScore.risk_metadata,
+    BusinessRiskScore.created_at,
+)
+
 
 # ---------------------------------------------------------------------------
 # Export result container
@@ -183,7 +223,7 @@ class BIExportService:
         date_to: date | None,
         limit: int,
     ) -> ExportResult:
-        stmt = select(CanonicalInsightRecord).order_by(
+        stmt = select(*_RECORD_COLUMNS).order_by(
             CanonicalInsightRecord.timestamp.desc()
         )
         if entity_name:
@@ -194,7 +234,7 @@ class BIExportService:
             stmt = stmt.where(CanonicalInsightRecord.timestamp <= _date_end(date_to))
         stmt = stmt.limit(limit)
 
-        rows = [self._flatten_record(r) for r in db.scalars(stmt)]
+        rows = [self._flatten_record(r) for r in db.execute(stmt)]
         return ExportResult(rows=rows, fields=_collect_fields(rows))
 
     def _export_kpis(
@@ -206,7 +246,7 @@ class BIExportService:
         date_to: date | None,
         limit: int,
     ) -> ExportResult:
-        stmt = select(ComputedKPI).order_by(ComputedKPI.period_end.desc())
+        stmt = select(*_KPI_COLUMNS).order_by(ComputedKPI.period_end.desc())
         if entity_name:
             stmt = stmt.where(ComputedKPI.entity_name == entity_name)
         if date_from:
@@ -217,7 +257,7 @@ class BIExportService:
 
         # Expand each KPI record into one row per metric (tall format).
         rows: list[dict[str, Any]] = []
-        for kpi in db.scalars(stmt):
+        for kpi in db.execute(stmt):
             rows.extend(self._flatten_kpi(kpi))
         return ExportResult(rows=rows, fields=_collect_fields(rows))
 
@@ -230,7 +270,7 @@ class BIExportService:
         date_to: date | None,
         limit: int,
     ) -> ExportResult:
-        stmt = select(ForecastMetric).order_by(ForecastMetric.period_end.desc())
+        stmt = select(*_FORECAST_COLUMNS).order_by(ForecastMetric.period_end.desc())
         if entity_name:
             stmt = stmt.where(ForecastMetric.entity_name == entity_name)
         if date_from:
@@ -239,7 +279,7 @@ class BIExportService:
             stmt = stmt.where(ForecastMetric.period_end <= _date_end(date_to))
         stmt = stmt.limit(limit)
 
-        rows = [self._flatten_forecast(f) for f in db.scalars(stmt)]
+        rows = [self._flatten_forecast(f) for f in db.execute(stmt)]
         return ExportResult(rows=rows, fields=_collect_fields(rows))
 
     def _export_risk(
@@ -251,7 +291,7 @@ class BIExportService:
         date_to: date | None,
         limit: int,
     ) -> ExportResult:
-        stmt = select(BusinessRiskScore).order_by(BusinessRiskScore.period_end.desc())
+        stmt = select(*_RISK_COLUMNS).order_by(BusinessRiskScore.period_end.desc())
         if entity_name:
             stmt = stmt.where(BusinessRiskScore.entity_name == entity_name)
         if date_from:
@@ -260,14 +300,14 @@ class BIExportService:
             stmt = stmt.where(BusinessRiskScore.period_end <= _date_end(date_to))
         stmt = stmt.limit(limit)
 
-        rows = [self._flatten_risk(r) for r in db.scalars(stmt)]
+        rows = [self._flatten_risk(r) for r in db.execute(stmt)]
         return ExportResult(rows=rows, fields=_collect_fields(rows))
 
     # ------------------------------------------------------------------
     # Row flatteners
     # ------------------------------------------------------------------
 
-    def _flatten_record(self, r: CanonicalInsightRecord) -> dict[str, Any]:
+    def _flatten_record(self, r: Row[Any]) -> dict[str, Any]:
         """Flatten one canonical_insight_records row."""
         row: dict[str, Any] = {
             "id": str(r.id),
@@ -283,7 +323,7 @@ class BIExportService:
         _flatten_jsonb(r.metadata_json, "metadata", row)
         return row
 
-    def _flatten_kpi(self, k: ComputedKPI) -> list[dict[str, Any]]:
+    def _flatten_kpi(self, k: Row[Any]) -> list[dict[str, Any]]:
         """Expand one ComputedKPI row into one row per KPI metric (tall format)."""
         base: dict[str, Any] = {
             "kpi_id": str(k.id),
@@ -310,7 +350,7 @@ class BIExportService:
             rows.append(row)
         return rows
 
-    def _flatten_forecast(self, f: ForecastMetric) -> dict[str, Any]:
+    def _flatten_forecast(self, f: Row[Any]) -> dict[str, Any]:
         """Flatten one forecast_metric row."""
         row: dict[str, Any] = {
             "id": str(f.id),
@@ -328,7 +368,7 @@ class BIExportService:
         _flatten_jsonb(forecast_months, "forecast", row)
         return row
 
-    def _flatten_risk(self, r: BusinessRiskScore) -> dict[str, Any]:
+    def _flatten_risk(self, r: Row[Any]) -> dict[str, Any]:
         """Flatten one business_risk_scores row."""
         row: dict[str, Any] = {
             "id": str(r.id),
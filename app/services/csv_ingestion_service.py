@@ -9,9 +9,12 @@ No downstream analytics coupling.
 
 from __future__ import annotations
 
+import io
 import json
 import logging
+import mmap
 import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Any, Mapping, Sequence
@@ -98,6 +101,16 @@ class CSVSchemaMappingError(CSVHeaderValidationError):
         }
 
 
+@dataclass(frozen=True)
+class _MappedColumnScan:
+    """Distinct mapped values and row count gathered in one CSV pass."""
+
+    entities: list[str]
+    categories: list[str]
+    metric_names: list[str]
+    row_count: int
+
+
 # ---------------------------------------------------------------------------
 # Metric-value coercion (numpy-backed)
 # ---------------------------------------------------------------------------
@@ -134,6 +147,28 @@ def _parse_metadata_cell(raw: str) -> dict[str, Any] | None:
     return json.loads(raw)  # already validated upstream
 
 
+def _memory_map_upload(file_obj: Any) -> mmap.mmap | None:
+    """
+    Return a read-only memory map of an upload that already lives on disk.
+
+    Large uploads are spilled by Starlette to a temporary file; mapping it
+    lets every pandas pass read straight from the page cache instead of
+    copying through Python file IO.  In-memory spools, non-file streams
+    and empty files return ``None`` so the caller keeps the original handle.
+    """
+    if not getattr(file_obj, "_rolled", True):
+        # SpooledTemporaryFile still in memory; fileno() would force a spill.
+        return None
+    try:
+        file_obj.flush()
+        fileno = file_obj.fileno()
+        if os.fstat(fileno).st_size == 0:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -192,7 +227,8 @@ class CSVIngestionService:
         Returns:
             IngestionSummary with row counts and any validation errors.
         """
-        raw_file = upload_file.file
+        mapped_file = _memory_map_upload(upload_file.file)
+        raw_file = mapped_file if mapped_file is not None else upload_file.file
         raw_file.seek(0)
 
         try:
@@ -325,12 +361,13 @@ class CSVIngestionService:
                     if str(entity).strip()
                 }
             )
+            column_scan = self._scan_mapped_columns(
+                raw_file=raw_file,
+                usecols=usecols,
+                rename_map=rename_map,
+            )
             if not detected_entities:
-                detected_entities = self._detect_entities_for_mapping(
-                    raw_file=raw_file,
-                    usecols=usecols,
-                    rename_map=rename_map,
-                )
+                detected_entities = column_scan.entities
             if not detected_entities:
                 return self._summary_with_error(
                     code="entity_name_unresolved",
@@ -345,11 +382,7 @@ class CSVIngestionService:
                     ingestion_status=IngestionStatus.EMPTY_DATASET,
                 )
 
-            detected_categories = self._detect_categories_for_mapping(
-                raw_file=raw_file,
-                usecols=usecols,
-                rename_map=rename_map,
-            )
+            detected_categories = column_scan.categories
             if not detected_categories:
                 return self._summary_with_error(
                     code="category_missing",
@@ -365,16 +398,10 @@ class CSVIngestionService:
                 )
 
             # --- Category inference ---
-            detected_metrics = self._detect_distinct_values_for_mapping(
-                raw_file=raw_file,
-                usecols=usecols,
-                rename_map=rename_map,
-                canonical_field="metric_name",
-            )
             inference_result = self._run_category_inference(
-                metric_names=detected_metrics,
+                metric_names=column_scan.metric_names,
                 column_names=headers,
-                row_count=self._estimate_row_count(raw_file, usecols),
+                row_count=column_scan.row_count,
                 unique_entity_count=len(detected_entities),
                 user_categories=detected_categories,
             )
@@ -652,6 +679,9 @@ class CSVIngestionService:
                 context={"error": str(exc)},
                 ingestion_status=IngestionStatus.FAILED,
             )
+        finally:
+            if mapped_file is not None:
+                mapped_file.close()
 
     def detect_csv_entities(
         self,
@@ -663,7 +693,8 @@ class CSVIngestionService:
         manual_mapping: Mapping[str, str] | None = None,
     ) -> list[str]:
         """Return unique entity_name values found in a CSV after schema mapping."""
-        raw_file = upload_file.file
+        mapped_file = _memory_map_upload(upload_file.file)
+        raw_file = mapped_file if mapped_file is not None else upload_file.file
         raw_file.seek(0)
 
         try:
@@ -694,6 +725,9 @@ class CSVIngestionService:
             raise CSVHeaderValidationError("CSV must be UTF-8 encoded.") from exc
         except pd.errors.ParserError as exc:
             raise CSVHeaderValidationError(f"Invalid CSV format: {exc}") from exc
+        finally:
+            if mapped_file is not None:
+                mapped_file.close()
 
     # ------------------------------------------------------------------
     # Vectorized chunk validation + normalization
@@ -1140,21 +1174,6 @@ class CSVIngestionService:
             canonical_field="entity_name",
         )
 
-    def _detect_categories_for_mapping(
-        self,
-        *,
-        raw_file: Any,
-        usecols: Sequence[str],
-        rename_map: Mapping[str, str],
-    ) -> list[str]:
-        """Scan CSV and return sorted unique, non-empty category values."""
-        return self._detect_distinct_values_for_mapping(
-            raw_file=raw_file,
-            usecols=usecols,
-            rename_map=rename_map,
-            canonical_field="category",
-        )
-
     def _detect_distinct_values_for_mapping(
         self,
         *,
@@ -1183,29 +1202,48 @@ class CSVIngestionService:
         raw_file.seek(0)
         return sorted(values_set)
 
-    def _estimate_row_count(
+    def _scan_mapped_columns(
         self,
+        *,
         raw_file: Any,
         usecols: Sequence[str],
-    ) -> int:
-        """Estimate total row count without reading entire file."""
+        rename_map: Mapping[str, str],
+    ) -> _MappedColumnScan:
+        """
+        Stream the CSV once and collect every pre-ingest statistic.
+
+        Entities, categories, metric names and the row count used to be
+        gathered by four separate chunked reads of the upload; one pass
+        yields the same values.
+        """
         raw_file.seek(0)
-        count = 0
-        try:
-            reader = pd.read_csv(
-                raw_file,
-                chunksize=self._chunksize,
-                dtype=str,
-                encoding="utf-8-sig",
-                usecols=list(usecols),
-                keep_default_na=False,
-            )
-            for chunk in reader:
-                count += len(chunk)
-        except Exception:
-            pass
+        distinct: dict[str, set[str]] = {
+            field: set() for field in ("entity_name", "category", "metric_name")
+        }
+        row_count = 0
+        reader = pd.read_csv(
+            raw_file,
+            chunksize=self._chunksize,
+            dtype=str,
+            encoding="utf-8-sig",
+            usecols=list(usecols),
+            keep_default_na=False,
+        )
+        for chunk in reader:
+            row_count += len(chunk)
+            chunk = chunk.rename(columns=rename_map)
+            for field, values_set in distinct.items():
+                if field not in chunk.columns:
+                    continue
+                values = chunk[field].astype(str).str.strip()
+                values_set.update(value for value in values.tolist() if value)
         raw_file.seek(0)
-        return count
+        return _MappedColumnScan(
+            entities=sorted(distinct["entity_name"]),
+            categories=sorted(distinct["category"]),
+            metric_names=sorted(distinct["metric_name"]),
+            row_count=row_count,
+        )
 
     @staticmethod
     def _run_category_inference(
@@ -6,7 +6,11 @@ Orchestration service for external source ingestion.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
 from functools import lru_cache
 from typing import Sequence
 
@@ -22,16 +26,36 @@ from app.config import (
 )
 from app.connectors import (
     BaseConnector,
+    ConnectorFetchResult,
     ConnectorRequestError,
     GoogleTrendsConnector,
     NewsAPIConnector,
     WorldBankConnector,
 )
+from app.domain.canonical_insight import CanonicalInsightInput
 from app.domain.external_ingestion import SourceIngestionSummary
 from app.repositories.external_ingestion_repository import ExternalIngestionRepository
 
 logger = logging.getLogger(__name__)
 
+# Per-source memory of recently persisted record keys.  Feeds overlap
+# heavily between ticks; records already known to be stored are dropped
+# before the INSERT instead of being sent only to hit ON CONFLICT.
+_RECENT_KEYS_PER_SOURCE = 10_000
+
+_RecordKey = tuple[str, str, str, str, datetime]
+
+
+def _record_key(record: CanonicalInsightInput) -> _RecordKey:
+    """Key mirroring ``uq_canonical_insight_records_dedupe``."""
+    return (
+        record.source_type,
+        record.entity_name,
+        record.category,
+        record.metric_name,
+        record.timestamp,
+    )
+
 
 class ExternalIngestionService:
     """
@@ -46,6 +70,8 @@ class ExternalIngestionService:
     ) -> None:
         self._connectors = {connector.source: connector for connector in connectors}
         self._batch_size = max(1, batch_size)
+        self._persisted_keys: dict[str, OrderedDict[_RecordKey, None]] = {}
+        self._persisted_keys_lock = threading.Lock()
 
     def ingest(
         self,
@@ -58,32 +84,25 @@ class ExternalIngestionService:
         """
 
         selected_connectors = self._select_connectors(source)
+        outcomes = asyncio.run(self._fetch_all(selected_connectors))
         repository = ExternalIngestionRepository(db)
         summaries: list[SourceIngestionSummary] = []
 
-        for connector in selected_connectors:
-            try:
-                fetched = connector.fetch_records()
-            except ConnectorRequestError as exc:
-                logger.error(
-                    "External connector request failed source=%s error=%s",
-                    connector.source,
-                    exc,
-                )
-                summaries.append(
-                    SourceIngestionSummary(
-                        source=connector.source,
-                        records_inserted=0,
-                        failed_records=1,
+        for connector, fetched in zip(selected_connectors, outcomes):
+            if isinstance(fetched, BaseException):
+                if isinstance(fetched, ConnectorRequestError):
+                    logger.error(
+                        "External connector request failed source=%s error=%s",
+                        connector.source,
+                        fetched,
+                    )
+                else:
+                    logger.error(
+                        "Unhandled connector failure source=%s error=%s",
+                        connector.source,
+                        fetched,
+                        exc_info=fetched,
                     )
-                )
-                continue
-            except Exception as exc:
-                logger.exception(
-                    "Unhandled connector failure source=%s error=%s",
-                    connector.source,
-                    exc,
-                )
                 summaries.append(
                     SourceIngestionSummary(
                         source=connector.source,
@@ -95,10 +114,11 @@ class ExternalIngestionService:
 
             inserted = 0
             failed = fetched.failed_records
-            if fetched.records:
+            fresh_records = self._drop_persisted(connector.source, fetched.records)
+            if fresh_records:
                 try:
                     inserted = repository.bulk_insert_records(
-                        fetched.records,
+                        fresh_records,
                         batch_size=self._batch_size,
                     )
                     db.commit()
@@ -109,8 +129,10 @@ class ExternalIngestionService:
                         connector.source,
                         exc,
                     )
-                    failed += len(fetched.records)
+                    failed += len(fresh_records)
                     inserted = 0
+                else:
+                    self._mark_persisted(connector.source, fresh_records)
 
             summaries.append(
                 SourceIngestionSummary(
@@ -122,6 +144,56 @@ class ExternalIngestionService:
 
         return summaries
 
+    @staticmethod
+    async def _fetch_all(
+        connectors: Sequence[BaseConnector],
+    ) -> list[ConnectorFetchResult | BaseException]:
+        """
+        Fetch every connector concurrently on one event loop.
+
+        The connectors share this loop's pooled client, which is closed
+        before the loop exits since its pool cannot be reused from another.
+        """
+
+        try:
+            return await asyncio.gather(
+                *(connector.fetch_records_async() for connector in connectors),
+                return_exceptions=True,
+            )
+        finally:
+            for connector in connectors:
+                await connector.aclose()
+
+    def _drop_persisted(
+        self,
+        source: str,
+        records: Sequence[CanonicalInsightInput],
+    ) -> list[CanonicalInsightInput]:
+        with self._persisted_keys_lock:
+            seen = self._persisted_keys.get(source)
+            if not seen:
+                return list(records)
+            fresh: list[CanonicalInsightInput] = []
+            for record in records:
+                key = _record_key(record)
+                if key in seen:
+                    seen.move_to_end(key)  # still in the feed; keep it warm
+                else:
+                    fresh.append(record)
+            return fresh
+
+    def _mark_persisted(self, source: str, records: Sequence[CanonicalInsightInput]) -> None:
+        """
+        Remember keys only after commit, so a rolled-back batch is retried.
+        """
+
+        with self._persisted_keys_lock:
+            seen = self._persisted_keys.setdefault(source, OrderedDict())
+            for record in records:
+                seen[_record_key(record)] = None
+            while len(seen) > _RECENT_KEYS_PER_SOURCE:
+                seen.popitem(last=False)
+
     def _select_connectors(self, source: str | None) -> list[BaseConnector]:
         if source is None:
             return list(self._connectors.values())
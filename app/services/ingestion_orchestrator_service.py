@@ -4,15 +4,19 @@ Orchestrator service for async ingestion job dispatch and lifecycle tracking.
 
 from __future__ import annotations
 
+import io
 import logging
 import os
+import shutil
 import tempfile
 import uuid
 from collections.abc import Callable
+from datetime import datetime
 from functools import lru_cache
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, BinaryIO, Protocol
 
 from fastapi import BackgroundTasks, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.failure_codes import OPTIONAL_FAILURES
@@ -28,8 +32,43 @@ from app.services.external_ingestion_service import (
 from db.models.ingestion_job import IngestionJob, IngestionJobType
 from db.repositories.ingestion_job_repository import IngestionJobRepository
 
+if TYPE_CHECKING:
+    from app.services.kpi_recompute_pipeline import KPIRecomputePipeline
+
 logger = logging.getLogger(__name__)
 
+_UPLOAD_COPY_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def _copy_upload(src: BinaryIO, dst: BinaryIO) -> int:
+    """
+    Copy an upload spool into ``dst`` and return the byte count.
+
+    Once Starlette's spool has rolled over to disk both ends are real files,
+    so ``os.sendfile`` moves the bytes in-kernel without a round trip through
+    Python buffers.  In-memory spools and platforms without ``sendfile`` use
+    a large-buffer ``copyfileobj``.
+    """
+    if getattr(src, "_rolled", True) and hasattr(os, "sendfile"):
+        try:
+            in_fd = src.fileno()
+            out_fd = dst.fileno()
+            dst.flush()
+            offset = 0
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, _UPLOAD_COPY_CHUNK_BYTES)
+                if sent == 0:
+                    return offset
+                offset += sent
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # sendfile never moves src's position; restart the copy in Python.
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+
+    shutil.copyfileobj(src, dst, _UPLOAD_COPY_CHUNK_BYTES)
+    return dst.tell()
+
 
 class IngestionTaskExecutor(Protocol):
     def submit(self, task: Callable[..., None], *args: Any, **kwargs: Any) -> None:
@@ -37,6 +76,14 @@ class IngestionTaskExecutor(Protocol):
 
 
 class FastAPIBackgroundTaskExecutor:
+    """
+    Runs jobs as FastAPI background tasks after the response is sent.
+
+    Submitted callables receive only plain identifiers and open their own
+    session from the orchestrator's ``session_factory``; the request session
+    must not leak into them since it is closed when the handler returns.
+    """
+
     def __init__(self, background_tasks: BackgroundTasks) -> None:
         self._background_tasks = background_tasks
 
@@ -56,6 +103,7 @@ class IngestionOrchestratorService:
         csv_service: CSVIngestionService | None = None,
         external_service: ExternalIngestionService | None = None,
         competitor_service: CompetitorScrapingService | None = None,
+        kpi_pipeline: KPIRecomputePipeline | None = None,
     ) -> None:
         if session_factory is None:
             from db.session import SessionLocal
@@ -67,6 +115,8 @@ class IngestionOrchestratorService:
         self._csv_service = csv_service or get_csv_ingestion_service()
         self._external_service = external_service or get_external_ingestion_service()
         self._competitor_service = competitor_service or get_competitor_scraping_service()
+        # Built on first use: it pulls in the forecast/risk stacks.
+        self._kpi_pipeline = kpi_pipeline
 
     def trigger_csv_ingestion(
         self,
@@ -166,6 +216,44 @@ class IngestionOrchestratorService:
 
         return job
 
+    def trigger_kpi_recompute(
+        self,
+        *,
+        db: Session,
+        executor: IngestionTaskExecutor,
+        entity_name: str,
+        business_type: str,
+        include_segmentation: bool = False,
+    ) -> IngestionJob:
+        repository = IngestionJobRepository(db)
+        with db.begin():
+            job = repository.create_job(
+                job_type=IngestionJobType.KPI_RECOMPUTE,
+                request_payload={
+                    "entity_name": entity_name,
+                    "business_type": business_type,
+                    "include_segmentation": include_segmentation,
+                },
+            )
+
+        try:
+            executor.submit(
+                self._run_kpi_recompute_job,
+                job.id,
+                entity_name,
+                business_type,
+                include_segmentation,
+            )
+        except Exception:
+            with db.begin():
+                repository.mark_failed(
+                    job_id=job.id,
+                    error_message="Failed to schedule KPI recompute job.",
+                )
+            raise
+
+        return job
+
     def get_job_status(self, *, db: Session, job_id: uuid.UUID) -> IngestionJob | None:
         repository = IngestionJobRepository(db)
         return repository.get_job(job_id)
@@ -177,12 +265,142 @@ class IngestionOrchestratorService:
         limit: int = 100,
         job_type: str | None = None,
         status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+        include_payload: bool = False,
     ) -> list[IngestionJob]:
         repository = IngestionJobRepository(db)
         return repository.list_jobs(
             limit=limit,
             job_type=job_type,
             status=status,
+            before_created_at=before_created_at,
+            before_id=before_id,
+            include_payload=include_payload,
+        )
+
+    def job_list_fingerprint(
+        self,
+        *,
+        db: Session,
+        job_type: str | None = None,
+        status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+    ) -> tuple[datetime | None, int]:
+        repository = IngestionJobRepository(db)
+        return repository.list_fingerprint(
+            job_type=job_type,
+            status=status,
+            before_created_at=before_created_at,
+            before_id=before_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Async request-path variants
+    #
+    # The sync methods above stay the single source of truth; these run them
+    # on the AsyncSession's connection via ``run_sync`` so async handlers can
+    # await the DB round-trips without occupying a threadpool worker.
+    # ------------------------------------------------------------------
+
+    async def trigger_api_ingestion_async(
+        self,
+        *,
+        db: AsyncSession,
+        executor: IngestionTaskExecutor,
+        source: str | None = None,
+    ) -> IngestionJob:
+        return await db.run_sync(
+            lambda session: self.trigger_api_ingestion(
+                db=session,
+                executor=executor,
+                source=source,
+            )
+        )
+
+    async def trigger_competitor_scraping_async(
+        self,
+        *,
+        db: AsyncSession,
+        executor: IngestionTaskExecutor,
+        competitor: str | None = None,
+    ) -> IngestionJob:
+        return await db.run_sync(
+            lambda session: self.trigger_competitor_scraping(
+                db=session,
+                executor=executor,
+                competitor=competitor,
+            )
+        )
+
+    async def trigger_kpi_recompute_async(
+        self,
+        *,
+        db: AsyncSession,
+        executor: IngestionTaskExecutor,
+        entity_name: str,
+        business_type: str,
+        include_segmentation: bool = False,
+    ) -> IngestionJob:
+        return await db.run_sync(
+            lambda session: self.trigger_kpi_recompute(
+                db=session,
+                executor=executor,
+                entity_name=entity_name,
+                business_type=business_type,
+                include_segmentation=include_segmentation,
+            )
+        )
+
+    async def get_job_status_async(
+        self,
+        *,
+        db: AsyncSession,
+        job_id: uuid.UUID,
+    ) -> IngestionJob | None:
+        return await db.run_sync(lambda session: self.get_job_status(db=session, job_id=job_id))
+
+    async def list_job_statuses_async(
+        self,
+        *,
+        db: AsyncSession,
+        limit: int = 100,
+        job_type: str | None = None,
+        status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+        include_payload: bool = False,
+    ) -> list[IngestionJob]:
+        return await db.run_sync(
+            lambda session: self.list_job_statuses(
+                db=session,
+                limit=limit,
+                job_type=job_type,
+                status=status,
+                before_created_at=before_created_at,
+                before_id=before_id,
+                include_payload=include_payload,
+            )
+        )
+
+    async def job_list_fingerprint_async(
+        self,
+        *,
+        db: AsyncSession,
+        job_type: str | None = None,
+        status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+    ) -> tuple[datetime | None, int]:
+        return await db.run_sync(
+            lambda session: self.job_list_fingerprint(
+                db=session,
+                job_type=job_type,
+                status=status,
+                before_created_at=before_created_at,
+                before_id=before_id,
+            )
         )
 
     def _run_csv_ingestion_job(
@@ -308,6 +526,41 @@ class IngestionOrchestratorService:
             except Exception as exc:
                 self._mark_job_failed(db=db, job_id=job_id, exc=exc)
 
+    def _run_kpi_recompute_job(
+        self,
+        job_id: uuid.UUID,
+        entity_name: str,
+        business_type: str,
+        include_segmentation: bool,
+    ) -> None:
+        with self._session_factory() as db:
+            repository = IngestionJobRepository(db)
+            try:
+                running_job = repository.mark_running(job_id=job_id)
+                if running_job is None:
+                    raise RuntimeError(f"Ingestion job not found: {job_id}")
+                db.commit()
+
+                result_payload = self._get_kpi_pipeline().run(
+                    db=db,
+                    entity_name=entity_name,
+                    business_type=business_type,
+                    include_segmentation=include_segmentation,
+                )
+                completed_job = repository.mark_completed(job_id=job_id, result_payload=result_payload)
+                if completed_job is None:
+                    raise RuntimeError(f"Ingestion job not found: {job_id}")
+                db.commit()
+            except Exception as exc:
+                self._mark_job_failed(db=db, job_id=job_id, exc=exc)
+
+    def _get_kpi_pipeline(self) -> KPIRecomputePipeline:
+        if self._kpi_pipeline is None:
+            from app.services.kpi_recompute_pipeline import KPIRecomputePipeline
+
+            self._kpi_pipeline = KPIRecomputePipeline(session_factory=self._session_factory)
+        return self._kpi_pipeline
+
     def _mark_job_failed(self, *, db: Session, job_id: uuid.UUID, exc: Exception) -> None:
         repository = IngestionJobRepository(db)
         error_message = f"{type(exc).__name__}: {exc}"
@@ -332,15 +585,12 @@ class IngestionOrchestratorService:
         upload_file.file.seek(0)
 
         with tempfile.NamedTemporaryFile(delete=False, prefix="ingestion_job_", suffix=suffix) as temp_file:
-            while True:
-                chunk = upload_file.file.read(1024 * 1024)
-                if not chunk:
-                    break
-                temp_file.write(chunk)
+            file_size = _copy_upload(upload_file.file, temp_file)
             temp_path = temp_file.name
-            file_size = temp_file.tell()
 
-        upload_file.file.seek(0)
+        # The job reads the temp copy; release the request spool right away
+        # instead of holding it through the job-row round trip.
+        upload_file.file.close()
         return temp_path, file_size
 
     def _delete_file_quietly(self, file_path: str) -> None:
@@ -51,6 +51,7 @@ import uuid
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -635,6 +636,12 @@ class KPIOrchestrator:
             ) from exc
 
 
+@lru_cache(maxsize=1)
+def get_kpi_orchestrator() -> KPIOrchestrator:
+    """Return the process-wide orchestrator; sessions are passed per ``run``."""
+    return KPIOrchestrator()
+
+
 # ---------------------------------------------------------------------------
 # Internal data containers (not part of public API)
 # ---------------------------------------------------------------------------
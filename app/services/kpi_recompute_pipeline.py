@@ -0,0 +1,352 @@
+"""
+app/services/kpi_recompute_pipeline.py
+
+KPI recompute pipeline executed as a background ingestion job.
+
+Runs the full analytics pipeline for one entity:
+    KPIOrchestrator → ForecastOrchestrator → RiskOrchestrator
+
+Segmentation is optional and must be explicitly requested.  It only depends
+on the KPI result, so it runs concurrently with the forecast → risk chain.
+
+Each step after KPI is independent; failures are collected in
+``pipeline_errors`` without aborting the other steps.  Only fatal KPI
+aggregation/persistence errors propagate, which fails the job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.services.category_registry import primary_metric_for_business_type
+from app.services.kpi_orchestrator import (
+    KPIAggregationError,
+    KPIOrchestrator,
+    KPIPersistenceError,
+    KPIRunResult,
+    get_kpi_orchestrator,
+)
+from forecast.orchestrator import ForecastOrchestrator
+from risk.orchestrator import RiskOrchestrator
+
+logger = logging.getLogger(__name__)
+
+_RECOMPUTE_LOOKBACK = timedelta(days=90)
+
+
+# ---------------------------------------------------------------------------
+# Analytics helpers
+# ---------------------------------------------------------------------------
+
+
+def _extract_primary_metric_values(
+    kpi_result: KPIRunResult | None,
+    metric_name: str,
+) -> list[float]:
+    """Return a single-element list from the named KPI metric value."""
+    if kpi_result is None:
+        return []
+    entry = kpi_result.metrics.get(metric_name, {})
+    value = entry.get("value")
+    if not isinstance(value, (int, float)):
+        return []
+    return [float(value)]
+
+
+def _generate_monthly_windows(
+    period_start: datetime,
+    period_end: datetime,
+) -> list[tuple[datetime, datetime]]:
+    """Split a date range into calendar-month windows."""
+    start = period_start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    windows: list[tuple[datetime, datetime]] = []
+    while start <= period_end:
+        end = start + relativedelta(months=1)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+def _segmentation_record_count(kpi_result: KPIRunResult | None) -> int:
+    """
+    Number of records ``_build_segmentation_records`` would return, without
+    building them: one flat record when any metric is numeric, else none.
+    """
+    if kpi_result is None:
+        return 0
+    has_numeric = any(
+        isinstance(entry.get("value"), (int, float))
+        for entry in kpi_result.metrics.values()
+    )
+    return 1 if has_numeric else 0
+
+
+def _build_segmentation_records(
+    kpi_result: KPIRunResult | None,
+) -> list[dict]:
+    """Build a flat metric record list from a KPI result for segmentation."""
+    if kpi_result is None:
+        return []
+    flat: dict = {}
+    for name, entry in kpi_result.metrics.items():
+        value = entry.get("value")
+        if isinstance(value, (int, float)):
+            flat[name] = float(value)
+    return [flat] if flat else []
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class KPIRecomputePipeline:
+    """
+    Runs KPI → (Forecast → Risk ‖ Segmentation) for one entity.
+
+    The orchestrators are blocking, so each branch runs in a worker thread via
+    ``asyncio.to_thread``.  Branches that run concurrently never share a
+    Session: forecast → risk uses the caller's session, segmentation checks
+    out its own from ``session_factory`` so commits/rollbacks cannot
+    interleave on one connection.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: sessionmaker[Session] | None = None,
+        kpi_orchestrator: KPIOrchestrator | None = None,
+    ) -> None:
+        if session_factory is None:
+            from db.session import SessionLocal
+
+            self._session_factory = SessionLocal
+        else:
+            self._session_factory = session_factory
+        self._kpi_orchestrator = kpi_orchestrator or get_kpi_orchestrator()
+
+    def run(
+        self,
+        *,
+        db: Session,
+        entity_name: str,
+        business_type: str,
+        include_segmentation: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Execute the pipeline and return the job result payload.
+
+        Raises ``KPIAggregationError`` / ``KPIPersistenceError`` for
+        unrecoverable KPI failures.
+        """
+        return asyncio.run(
+            self._execute(
+                db=db,
+                entity_name=entity_name,
+                business_type=business_type,
+                include_segmentation=include_segmentation,
+            )
+        )
+
+    async def _execute(
+        self,
+        *,
+        db: Session,
+        entity_name: str,
+        business_type: str,
+        include_segmentation: bool,
+    ) -> dict[str, Any]:
+        metric_name = primary_metric_for_business_type(business_type)
+        now = datetime.now(tz=timezone.utc)
+        monthly_windows = _generate_monthly_windows(now - _RECOMPUTE_LOOKBACK, now)
+
+        pipeline_errors: list[str] = []
+        kpi_result: KPIRunResult | None = None
+        kpi_summary: dict | None = None
+        forecast_summary: dict | None = None
+        risk_summary: dict | None = None
+        seg_summary: dict | None = None
+
+        # --- Step 1: KPI recomputation (per-month windows) ---
+        all_kpi_results = await asyncio.to_thread(
+            self._run_kpi_windows,
+            db=db,
+            entity_name=entity_name,
+            business_type=business_type,
+            monthly_windows=monthly_windows,
+        )
+        if all_kpi_results:
+            kpi_result = all_kpi_results[-1]  # latest month for downstream use
+            kpi_summary = {
+                "record_id": str(kpi_result.record_id),
+                "has_errors": kpi_result.has_errors,
+                "metrics": kpi_result.metrics,
+                "windows_computed": len(all_kpi_results),
+            }
+        logger.info(
+            "KPI recomputed entity=%r business_type=%r windows=%d succeeded=%d",
+            entity_name, business_type,
+            len(monthly_windows), len(all_kpi_results),
+        )
+
+        # --- Steps 2-4: Forecast → Risk alongside Segmentation ---
+        chain = asyncio.to_thread(
+            self._run_forecast_then_risk,
+            db=db,
+            entity_name=entity_name,
+            metric_name=metric_name,
+            all_kpi_results=all_kpi_results,
+        )
+        if include_segmentation:
+            seg = asyncio.to_thread(
+                self._run_segmentation,
+                entity_name=entity_name,
+                kpi_result=kpi_result,
+            )
+        else:
+            seg = _skip_segmentation()
+        chain_outcome, seg_outcome = await asyncio.gather(chain, seg, return_exceptions=True)
+
+        if isinstance(chain_outcome, BaseException):
+            pipeline_errors.append(f"forecast: {chain_outcome}")
+            logger.warning("Forecast/risk chain failed entity=%r: %s", entity_name, chain_outcome)
+        else:
+            forecast_summary, risk_summary, chain_errors = chain_outcome
+            pipeline_errors.extend(chain_errors)
+
+        if isinstance(seg_outcome, BaseException):
+            pipeline_errors.append(f"segmentation: {seg_outcome}")
+            logger.warning("Segmentation failed entity=%r: %s", entity_name, seg_outcome)
+        else:
+            seg_summary, seg_errors = seg_outcome
+            pipeline_errors.extend(seg_errors)
+
+        return {
+            "entity_name": entity_name,
+            "business_type": business_type,
+            "kpi": kpi_summary,
+            "forecast": forecast_summary,
+            "risk": risk_summary,
+            "segmentation": seg_summary,
+            "pipeline_errors": pipeline_errors,
+        }
+
+    def _run_kpi_windows(
+        self,
+        *,
+        db: Session,
+        entity_name: str,
+        business_type: str,
+        monthly_windows: list[tuple[datetime, datetime]],
+    ) -> list[KPIRunResult]:
+        """Recompute KPIs per monthly window; non-fatal window failures are skipped."""
+        results: list[KPIRunResult] = []
+        for win_start, win_end in monthly_windows:
+            try:
+                result = self._kpi_orchestrator.run(
+                    entity_name=entity_name,
+                    business_type=business_type,
+                    period_start=win_start,
+                    period_end=win_end,
+                    db=db,
+                )
+                results.append(result)
+            except (KPIAggregationError, KPIPersistenceError):
+                raise  # fatal — fails the job
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "KPI recompute window failed entity=%r [%s, %s]: %s",
+                    entity_name, win_start.isoformat(), win_end.isoformat(), exc,
+                )
+        return results
+
+    def _run_forecast_then_risk(
+        self,
+        *,
+        db: Session,
+        entity_name: str,
+        metric_name: str,
+        all_kpi_results: list[KPIRunResult],
+    ) -> tuple[dict | None, dict | None, list[str]]:
+        """Run forecast then risk scoring; returns (forecast, risk, errors)."""
+        errors: list[str] = []
+        forecast_summary: dict | None = None
+        risk_summary: dict | None = None
+
+        # --- Forecast (uses all monthly metric values) ---
+        try:
+            values: list[float] = []
+            for r in all_kpi_results:
+                for v in _extract_primary_metric_values(r, metric_name):
+                    values.append(v)
+            forecast_result = ForecastOrchestrator(db).generate_forecast(
+                entity_name=entity_name,
+                metric_name=metric_name,
+                values=values,
+            )
+            if "error" in forecast_result:
+                errors.append(f"forecast: {forecast_result['error']}")
+            else:
+                db.commit()
+                forecast_summary = forecast_result
+        except Exception as exc:  # noqa: BLE001
+            db.rollback()
+            errors.append(f"forecast: {exc}")
+            logger.warning("Forecast failed entity=%r: %s", entity_name, exc)
+
+        # --- Risk scoring ---
+        try:
+            risk_result = RiskOrchestrator(db).generate_risk_score(
+                entity_name=entity_name,
+                kpi_data={},
+                forecast_data=forecast_summary or {},
+            )
+            db.commit()
+            risk_summary = risk_result
+        except Exception as exc:  # noqa: BLE001
+            db.rollback()
+            errors.append(f"risk: {exc}")
+            logger.warning("Risk scoring failed entity=%r: %s", entity_name, exc)
+
+        return forecast_summary, risk_summary, errors
+
+    def _run_segmentation(
+        self,
+        *,
+        entity_name: str,
+        kpi_result: KPIRunResult | None,
+    ) -> tuple[dict | None, list[str]]:
+        """Cluster the latest KPI metrics on a dedicated session; returns (summary, errors)."""
+        n_clusters = min(3, _segmentation_record_count(kpi_result))
+        if n_clusters < 1:
+            return None, ["segmentation: insufficient records for clustering"]
+
+        seg_records = _build_segmentation_records(kpi_result)
+
+        from segmentation.orchestrator import SegmentationOrchestrator
+
+        with self._session_factory() as seg_db:
+            try:
+                seg_result = SegmentationOrchestrator(session=seg_db).run_segmentation(
+                    entity_name=entity_name,
+                    records=seg_records,
+                    n_clusters=n_clusters,
+                )
+                seg_db.commit()
+            except Exception as exc:  # noqa: BLE001
+                seg_db.rollback()
+                logger.warning("Segmentation failed entity=%r: %s", entity_name, exc)
+                return None, [f"segmentation: {exc}"]
+        return {"n_clusters": seg_result.get("n_clusters")}, []
+
+
+async def _skip_segmentation() -> tuple[dict | None, list[str]]:
+    return None, []
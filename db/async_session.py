@@ -0,0 +1,81 @@
+"""
+db/async_session.py
+
+Async SQLAlchemy engine and session factory.
+
+Backed by psycopg 3's native async driver (already a core dependency), so
+the same ``postgresql+psycopg://`` URL resolved for the sync engine works
+here unchanged.  Lightweight request handlers use this to avoid tying up a
+threadpool worker while they wait on the database.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from db.session import _get_bool_env, _get_int_env, _json_engine_options, _validate_env
+
+
+def create_async_db_engine() -> AsyncEngine:
+    database_url = _validate_env()
+    if not database_url.startswith("postgresql"):
+        raise RuntimeError("Only PostgreSQL URLs are supported.")
+
+    return create_async_engine(
+        database_url,
+        echo=_get_bool_env("SQL_ECHO", default=False),
+        pool_pre_ping=True,
+        pool_recycle=_get_int_env("DB_POOL_RECYCLE", 1800),
+        pool_size=_get_int_env("DB_ASYNC_POOL_SIZE", 20),
+        max_overflow=_get_int_env("DB_ASYNC_MAX_OVERFLOW", 10),
+        **_json_engine_options(),
+    )
+
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the shared async engine, creating it on first call."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def _get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Lazy async session factory. Use as ``async with AsyncSessionLocal() as s``."""
+    return _get_async_session_factory()()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections; no-op when the engine was never built."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
@@ -9,7 +9,7 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Index, String, UniqueConstraint
+from sqlalchemy import Boolean, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -46,5 +46,5 @@ class Client(Base, TimestampMixin):
         UniqueConstraint("name", name="uq_clients_name"),
         Index("ix_clients_name", "name"),
         Index("ix_clients_domain", "domain"),
-        Index("ix_clients_is_active", "is_active"),
+        Index("ix_clients_inactive", "id", postgresql_where=text("NOT is_active")),
     )
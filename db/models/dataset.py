@@ -10,7 +10,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -87,7 +87,21 @@ class Dataset(Base, TimestampMixin):
     __table_args__ = (
         Index("ix_datasets_client_id", "client_id"),
         Index("ix_datasets_status", "status"),
-        Index("ix_datasets_source_type", "source_type"),
-        Index("ix_datasets_processed_at", "processed_at"),
+        Index(
+            "ix_datasets_client_source_api",
+            "client_id",
+            postgresql_where=text("source_type = 'api'"),
+        ),
+        Index(
+            "ix_datasets_client_source_manual",
+            "client_id",
+            postgresql_where=text("source_type = 'manual'"),
+        ),
+        Index(
+            "ix_datasets_processed_at_brin",
+            "processed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_datasets_client_status", "client_id", "status"),
     )
@@ -10,7 +10,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy import DateTime, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -21,6 +21,7 @@ class IngestionJobType:
     CSV = "csv"
     API = "api"
     COMPETITOR_SCRAPING = "competitor_scraping"
+    KPI_RECOMPUTE = "kpi_recompute"
 
 
 class IngestionJobStatus:
@@ -72,8 +73,24 @@ class IngestionJob(Base, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("ix_ingestion_jobs_job_type", "job_type"),
         Index("ix_ingestion_jobs_status", "status"),
         Index("ix_ingestion_jobs_created_at", "created_at"),
-        Index("ix_ingestion_jobs_job_type_status", "job_type", "status"),
+        # Column order matches /ingestion-status: equality filters first,
+        # then the (created_at, id) DESC keyset sort so LIMIT stops early.
+        Index(
+            "ix_ingestion_jobs_type_status_created",
+            "job_type",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        # Failed / in-flight jobs are a small slice of a table dominated by
+        # completed rows; this keeps those lookups off the completed rows.
+        Index(
+            "ix_ingestion_jobs_active_type_created",
+            "job_type",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("status IN ('pending', 'running', 'failed')"),
+        ),
     )
@@ -8,8 +8,8 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session, defer
 
 from db.models.ingestion_job import IngestionJob, IngestionJobStatus
 
@@ -43,17 +43,67 @@ class IngestionJobRepository:
         limit: int = 100,
         job_type: str | None = None,
         status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+        include_payload: bool = False,
     ) -> list[IngestionJob]:
-        stmt: Select[tuple[IngestionJob]] = select(IngestionJob)
+        """
+        List jobs newest first.
+
+        Pass the last row's ``(created_at, id)`` as ``before_*`` to fetch the
+        next page: the row-value comparison walks the index from the cursor
+        instead of skipping an OFFSET.
 
-        if job_type:
-            stmt = stmt.where(IngestionJob.job_type == job_type)
-        if status:
-            stmt = stmt.where(IngestionJob.status == status)
+        The JSONB payload columns are not fetched unless ``include_payload``
+        is set; touching them on the returned rows then raises instead of
+        issuing a lazy load per row.
+        """
+        stmt: Select[tuple[IngestionJob]] = select(IngestionJob)
+        if not include_payload:
+            stmt = stmt.options(
+                defer(IngestionJob.request_payload, raiseload=True),
+                defer(IngestionJob.result_payload, raiseload=True),
+            )
 
-        stmt = stmt.order_by(IngestionJob.created_at.desc()).limit(max(1, limit))
+        stmt = _apply_list_filters(
+            stmt,
+            job_type=job_type,
+            status=status,
+            before_created_at=before_created_at,
+            before_id=before_id,
+        )
+        stmt = stmt.order_by(
+            IngestionJob.created_at.desc(),
+            IngestionJob.id.desc(),
+        ).limit(max(1, limit))
         return list(self._session.scalars(stmt).all())
 
+    def list_fingerprint(
+        self,
+        *,
+        job_type: str | None = None,
+        status: str | None = None,
+        before_created_at: datetime | None = None,
+        before_id: uuid.UUID | None = None,
+    ) -> tuple[datetime | None, int]:
+        """
+        Return ``(max(updated_at), count(*))`` over the rows ``list_jobs``
+        filters on.
+
+        Every job transition bumps ``updated_at`` and every new job bumps the
+        count, so the pair changes whenever the listing could.
+        """
+        stmt = select(func.max(IngestionJob.updated_at), func.count())
+        stmt = _apply_list_filters(
+            stmt,
+            job_type=job_type,
+            status=status,
+            before_created_at=before_created_at,
+            before_id=before_id,
+        )
+        max_updated_at, row_count = self._session.execute(stmt).one()
+        return max_updated_at, int(row_count)
+
     def mark_running(self, *, job_id: uuid.UUID) -> IngestionJob | None:
         job = self.get_job(job_id)
         if job is None:
@@ -95,3 +145,22 @@ class IngestionJobRepository:
         if result_payload is not None:
             job.result_payload = result_payload
         return job
+
+
+def _apply_list_filters(
+    stmt: Select[Any],
+    *,
+    job_type: str | None,
+    status: str | None,
+    before_created_at: datetime | None,
+    before_id: uuid.UUID | None,
+) -> Select[Any]:
+    if job_type:
+        stmt = stmt.where(IngestionJob.job_type == job_type)
+    if status:
+        stmt = stmt.where(IngestionJob.status == status)
+    if before_created_at is not None and before_id is not None:
+        stmt = stmt.where(
+            tuple_(IngestionJob.created_at, IngestionJob.id) < (before_created_at, before_id)
+        )
+    return stmt
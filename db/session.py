@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import Generator
+from typing import Any
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
@@ -15,6 +16,11 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from db.config import resolve_database_url
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 
 def _get_bool_env(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
@@ -33,6 +39,18 @@ def _get_int_env(name: str, default: int) -> int:
         return default
 
 
+def _orjson_dumps(value: Any) -> str:
+    # Non-string dict keys are stringified, as the stdlib ``json`` does.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _json_engine_options() -> dict[str, Any]:
+    """JSON/JSONB codec for the engine: orjson when installed, else SQLAlchemy's default."""
+    if orjson is None:
+        return {}
+    return {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+
+
 def _validate_env() -> str:
     """Resolve and validate database configuration. Raises if env is misconfigured."""
     return resolve_database_url()
@@ -50,6 +68,7 @@ def create_db_engine() -> Engine:
         pool_recycle=_get_int_env("DB_POOL_RECYCLE", 1800),
         pool_size=_get_int_env("DB_POOL_SIZE", 5),
         max_overflow=_get_int_env("DB_MAX_OVERFLOW", 10),
+        **_json_engine_options(),
     )
 
 
@@ -32,7 +32,7 @@ class BusinessRiskScore(Base):
     Indexes:
         - tenant_id, entity_id (individual)
         - entity_name (individual, backward compatibility lookup)
-        - period_end (individual)
+        - period_end (BRIN, time-ordered range scans)
         - (tenant_id, entity_id, period_end) composite
         - (tenant_id, entity_name, period_end) fallback composite
     """
@@ -53,6 +53,12 @@ class BusinessRiskScore(Base):
             "entity_name",
             "period_end",
         ),
+        Index(
+            "ix_business_risk_scores_period_end_brin",
+            "period_end",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -80,7 +86,6 @@ class BusinessRiskScore(Base):
     period_end: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
     risk_score: Mapped[int] = mapped_column(
         Integer,
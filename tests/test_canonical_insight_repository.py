@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.domain.canonical_insight import CanonicalInsightInput
+from app.repositories.canonical_insight_repository import CanonicalInsightRepository
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.chunks: list[list[dict]] = []
+        self._rows: list = []
+
+    def scalars(self, _stmt, params, execution_options=None):
+        self.chunks.append(list(params))
+        self._rows = list(range(len(params)))
+        return self
+
+    def all(self) -> list:
+        return self._rows
+
+
+def _row(entity: str, value: float, *, day: int = 1) -> CanonicalInsightInput:
+    return CanonicalInsightInput(
+        source_type="api",
+        entity_name=entity,
+        category="pricing",
+        metric_name="price",
+        metric_value=value,
+        timestamp=datetime(2026, 1, day, tzinfo=timezone.utc),
+    )
+
+
+def test_bulk_insert_keeps_first_payload_per_dedupe_key() -> None:
+    session = _RecordingSession()
+    inserted = CanonicalInsightRepository(session).bulk_insert(  # type: ignore[arg-type]
+        [_row("acme", 1.0), _row("globex", 2.0), _row("acme", 3.0)],
+    )
+
+    assert inserted == 2
+    assert [(p["entity_name"], p["metric_value"]) for p in session.chunks[0]] == [
+        ("acme", 1.0),
+        ("globex", 2.0),
+    ]
+
+
+def test_bulk_insert_sends_payloads_in_batch_size_chunks() -> None:
+    session = _RecordingSession()
+    inserted = CanonicalInsightRepository(session).bulk_insert(  # type: ignore[arg-type]
+        [_row("acme", float(day), day=day) for day in range(1, 6)],
+        batch_size=2,
+    )
+
+    assert inserted == 5
+    assert [len(chunk) for chunk in session.chunks] == [2, 2, 1]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from app.config import ExternalHTTPSettings
+from app.connectors import base as connector_base
+from app.connectors.base import BaseConnector, ConnectorFetchResult, ConnectorRequestError
+
+
+class _EchoConnector(BaseConnector):
+    async def fetch_records_async(self) -> ConnectorFetchResult:
+        payload = await self._request_json(method="GET", url="https://example.test/items")
+        return ConnectorFetchResult(source=self.source, records=[], failed_records=len(payload["items"]))
+
+
+def _settings() -> ExternalHTTPSettings:
+    return ExternalHTTPSettings(
+        timeout_seconds=1.0,
+        max_retries=2,
+        backoff_initial_seconds=0.0,
+        backoff_multiplier=1.0,
+        rate_limit_per_second=0.0,
+    )
+
+
+def test_request_retries_retryable_status_then_succeeds() -> None:
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"items": [1, 2]})
+
+    async def _run() -> ConnectorFetchResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            connector = _EchoConnector(source="echo", http_settings=_settings(), client=client)
+            return await connector.fetch_records_async()
+
+    result = asyncio.run(_run())
+    assert result.failed_records == 2
+    assert len(calls) == 2
+
+
+def test_request_raises_immediately_on_non_retryable_status() -> None:
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(404)
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            connector = _EchoConnector(source="echo", http_settings=_settings(), client=client)
+            await connector.fetch_records_async()
+
+    with pytest.raises(ConnectorRequestError):
+        asyncio.run(_run())
+    assert len(calls) == 1
+
+
+def test_request_gives_up_on_persistent_retryable_status() -> None:
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(503)
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            connector = _EchoConnector(source="echo", http_settings=_settings(), client=client)
+            await connector.fetch_records_async()
+
+    with pytest.raises(ConnectorRequestError, match="after retries") as excinfo:
+        asyncio.run(_run())
+    assert len(calls) == 3
+    assert isinstance(excinfo.value.__cause__, httpx.HTTPStatusError)
+    assert excinfo.value.__cause__.response.status_code == 503
+
+
+def test_request_json_rejects_invalid_body() -> None:
+    async def _run() -> None:
+        transport = httpx.MockTransport(lambda _request: httpx.Response(200, content=b"{not json"))
+        async with httpx.AsyncClient(transport=transport) as client:
+            connector = _EchoConnector(source="echo", http_settings=_settings(), client=client)
+            await connector.fetch_records_async()
+
+    with pytest.raises(ConnectorRequestError, match="not valid JSON"):
+        asyncio.run(_run())
+
+
+def test_sync_fetch_records_closes_loop_shared_client(monkeypatch) -> None:
+    transport = httpx.MockTransport(lambda _request: httpx.Response(200, json={"items": []}))
+    original_init = httpx.AsyncClient.__init__
+    built: list[httpx.AsyncClient] = []
+
+    def _init(self, *args, **kwargs):
+        kwargs["transport"] = transport
+        original_init(self, *args, **kwargs)
+        built.append(self)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", _init)
+    connector = _EchoConnector(source="echo", http_settings=_settings())
+
+    assert connector.fetch_records().failed_records == 0
+    assert len(connector_base._SHARED_CLIENTS) == 0  # noqa: SLF001
+    # A second call from a fresh event loop must build a fresh pool.
+    assert connector.fetch_records().failed_records == 0
+    assert len(built) == 2
+    assert all(client.is_closed for client in built)
+
+
+def test_connectors_on_one_loop_share_a_client() -> None:
+    async def _run() -> bool:
+        first = _EchoConnector(source="first", http_settings=_settings())
+        second = _EchoConnector(source="second", http_settings=_settings())
+        try:
+            return first._get_client() is second._get_client()  # noqa: SLF001
+        finally:
+            await connector_base.aclose_shared_client()
+
+    assert asyncio.run(_run())
+
+
+def test_token_bucket_allows_burst_then_paces_at_rate(monkeypatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(connector_base.time, "monotonic", lambda: clock[0])
+    bucket = connector_base._TokenBucket(4.0)  # noqa: SLF001
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.25)
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock[0] += 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_token_bucket_is_shared_per_host_and_rate() -> None:
+    first = connector_base._token_bucket_for("api.example.test", 5.0)  # noqa: SLF001
+    assert connector_base._token_bucket_for("api.example.test", 5.0) is first  # noqa: SLF001
+    assert connector_base._token_bucket_for("other.example.test", 5.0) is not first  # noqa: SLF001
+
+
+def test_parse_iso_datetime_handles_zulu_offset_and_naive_values() -> None:
+    zulu = BaseConnector.parse_iso_datetime("2026-03-01T12:34:56Z")
+    offset = BaseConnector.parse_iso_datetime("2026-03-01T14:34:56+02:00")
+    naive = BaseConnector.parse_iso_datetime("2026-03-01T12:34:56")
+
+    assert zulu == offset == naive
+    assert naive.tzinfo is not None
+
+
+class _Py310Datetime(datetime):
+    """``datetime`` whose ``fromisoformat`` rejects ``Z`` as Python 3.10 does."""
+
+    @classmethod
+    def fromisoformat(cls, date_string: str) -> datetime:
+        if date_string.endswith("Z"):
+            raise ValueError(f"Invalid isoformat string: {date_string!r}")
+        return datetime.fromisoformat(date_string)
+
+
+def test_parse_iso_datetime_accepts_zulu_without_native_support(monkeypatch) -> None:
+    monkeypatch.setattr(connector_base, "datetime", _Py310Datetime)
+
+    parsed = BaseConnector.parse_iso_datetime("2026-03-01T12:34:56Z")
+
+    assert parsed == BaseConnector.parse_iso_datetime("2026-03-01T12:34:56+00:00")
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import io
+import tempfile
+
+from app.services.csv_ingestion_service import CSVIngestionService, _memory_map_upload
+
+
+def _service() -> CSVIngestionService:
+    return CSVIngestionService(
+        batch_size=1000,
+        max_validation_errors=100,
+        log_validation_errors=False,
+    )
+
+
+def test_scan_mapped_columns_collects_all_statistics_in_one_pass() -> None:
+    raw_file = io.BytesIO(
+        b"company,segment,kpi,value\n"
+        b"Acme,saas,mrr,100\n"
+        b"Globex,saas,churn_rate,0.1\n"
+        b" ,saas,mrr,50\n"
+    )
+
+    scan = _service()._scan_mapped_columns(  # noqa: SLF001
+        raw_file=raw_file,
+        usecols=["company", "segment", "kpi"],
+        rename_map={"company": "entity_name", "segment": "category", "kpi": "metric_name"},
+    )
+
+    assert scan.entities == ["Acme", "Globex"]
+    assert scan.categories == ["saas"]
+    assert scan.metric_names == ["churn_rate", "mrr"]
+    assert scan.row_count == 3
+    assert raw_file.tell() == 0
+
+
+def test_memory_map_upload_only_maps_spilled_files() -> None:
+    in_memory = tempfile.SpooledTemporaryFile(max_size=1024)
+    in_memory.write(b"entity_name\nAcme\n")
+    assert _memory_map_upload(in_memory) is None
+    assert not in_memory._rolled  # noqa: SLF001 - mapping must not force a spill
+
+    spilled = tempfile.SpooledTemporaryFile(max_size=4)
+    spilled.write(b"entity_name\nAcme\n")
+    mapped = _memory_map_upload(spilled)
+    assert mapped is not None
+    try:
+        assert mapped.read() == b"entity_name\nAcme\n"
+    finally:
+        mapped.close()
+        spilled.close()
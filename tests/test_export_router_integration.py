@@ -44,6 +44,26 @@ def test_export_powerbi_alias_returns_flat_json() -> None:
     assert payload["data"][0]["metric_name"] == "revenue"
 
 
+def test_export_bi_csv_download_uses_dataset_filename() -> None:
+    client = TestClient(_build_app())
+    response = client.get("/export/bi", params={"dataset": "kpis", "format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="kpis_export.csv"'
+    assert response.text.splitlines()[0] == "entity_name,metric_name,metric_value"
+
+
+def test_csv_line_matches_stdlib_quoting() -> None:
+    cells = ["acme", "a,b", 'say "hi"', "two\nlines", None, 1.5]
+    line = bi_export_router._csv_line(cells)  # noqa: SLF001
+    assert line == 'acme,"a,b","say ""hi""","two\nlines",,1.5\r\n'
+
+
+def test_export_bi_rejects_unknown_format_before_export() -> None:
+    client = TestClient(_build_app())
+    response = client.get("/export/bi", params={"dataset": "records", "format": "xml"})
+    assert response.status_code == 422
+
+
 def test_export_report_returns_insight_and_derived_signals(monkeypatch) -> None:
     class _FakeGraph:
         @staticmethod
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.connectors.base import BaseConnector, ConnectorFetchResult
+from app.domain.canonical_insight import CanonicalInsightInput
+from app.services import external_ingestion_service
+from app.services.external_ingestion_service import ExternalIngestionService
+
+
+def _record(entity_name: str) -> CanonicalInsightInput:
+    return CanonicalInsightInput(
+        source_type="api",
+        entity_name=entity_name,
+        category="event",
+        metric_name="news_article",
+        metric_value={"title": entity_name},
+        timestamp=datetime(2026, 3, 1, tzinfo=timezone.utc),
+    )
+
+
+class _StaticConnector(BaseConnector):
+    def __init__(self, batches: list[list[CanonicalInsightInput]]) -> None:
+        self.source = "news_api"
+        self._client = None
+        self._batches = batches
+
+    async def fetch_records_async(self) -> ConnectorFetchResult:
+        return ConnectorFetchResult(source=self.source, records=self._batches.pop(0))
+
+
+class _FakeRepository:
+    inserted_batches: list[list[str]] = []
+    fail_next = False
+
+    def __init__(self, _db) -> None:
+        pass
+
+    def bulk_insert_records(self, records, *, batch_size):
+        if _FakeRepository.fail_next:
+            _FakeRepository.fail_next = False
+            raise SQLAlchemyError("write failed")
+        _FakeRepository.inserted_batches.append([record.entity_name for record in records])
+        return len(records)
+
+
+class _FakeSession:
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+def test_records_persisted_on_a_previous_tick_are_not_resent(monkeypatch) -> None:
+    monkeypatch.setattr(external_ingestion_service, "ExternalIngestionRepository", _FakeRepository)
+    _FakeRepository.inserted_batches = []
+    _FakeRepository.fail_next = True
+    connector = _StaticConnector(
+        [
+            [_record("a"), _record("b")],
+            [_record("a"), _record("b")],
+            [_record("a"), _record("b"), _record("c")],
+        ]
+    )
+    service = ExternalIngestionService(connectors=[connector], batch_size=100)
+
+    failed_tick = service.ingest(db=_FakeSession())
+    retried_tick = service.ingest(db=_FakeSession())
+    overlapping_tick = service.ingest(db=_FakeSession())
+
+    # The rolled-back batch is retried in full; afterwards only "c" is new.
+    assert failed_tick[0].failed_records == 2
+    assert _FakeRepository.inserted_batches == [["a", "b"], ["c"]]
+    assert retried_tick[0].records_inserted == 2
+    assert overlapping_tick[0].records_inserted == 1
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+
+from app.config import ExternalHTTPSettings, GoogleTrendsSettings
+from app.connectors import base as connector_base
+from app.connectors.base import ConnectorFetchResult
+from app.connectors import google_trends_connector
+from app.connectors.google_trends_connector import GoogleTrendsConnector
+
+_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:ht="https://trends.google.com/trending/rss">
+  <channel>
+    <title>Daily Search Trends</title>
+    <item>
+      <title>solar eclipse</title>
+      <ht:approx_traffic>200K+</ht:approx_traffic>
+      <link>https://trends.google.com/trending/rss?geo=US</link>
+      <pubDate>Sun, 1 Mar 2026 12:00:00 -0800</pubDate>
+    </item>
+    <item>
+      <title>missing date</title>
+      <ht:approx_traffic>1,000+</ht:approx_traffic>
+    </item>
+    <item>
+      <title>beyond max items</title>
+      <pubDate>Sun, 1 Mar 2026 13:00:00 -0800</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def _fetch(body: bytes, *, max_items: int = 2) -> ConnectorFetchResult:
+    connector = GoogleTrendsConnector(
+        settings=GoogleTrendsSettings(max_items=max_items),
+        http_settings=ExternalHTTPSettings(
+            timeout_seconds=1.0,
+            max_retries=0,
+            backoff_initial_seconds=0.0,
+            backoff_multiplier=1.0,
+            rate_limit_per_second=0.0,
+        ),
+    )
+
+    async def _run() -> ConnectorFetchResult:
+        transport = httpx.MockTransport(lambda _request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            connector._client = client  # noqa: SLF001
+            return await connector.fetch_records_async()
+
+    return asyncio.run(_run())
+
+
+def test_parses_namespaced_traffic_and_stops_at_max_items() -> None:
+    result = _fetch(_FEED)
+
+    assert result.failed_records == 1
+    assert len(result.records) == 1
+    record = result.records[0]
+    assert record.entity_name == "solar eclipse"
+    assert record.metric_value == 200_000
+    assert record.timestamp == datetime(2026, 3, 1, 20, 0, tzinfo=timezone.utc)
+    assert record.metadata_json["link"] == "https://trends.google.com/trending/rss?geo=US"
+
+
+def test_malformed_feed_counts_one_failure() -> None:
+    result = _fetch(b"<rss><channel><item></rss>")
+
+    assert result.records == []
+    assert result.failed_records == 1
+
+
+def test_entity_declarations_are_not_expanded() -> None:
+    feed = b"""<?xml version="1.0"?>
+<!DOCTYPE rss [<!ENTITY secret SYSTEM "file:///etc/hostname">]>
+<rss><channel><item>
+  <title>&secret;</title>
+  <pubDate>Sun, 1 Mar 2026 12:00:00 GMT</pubDate>
+</item></channel></rss>
+"""
+    result = _fetch(feed)
+
+    # The unresolved reference leaves an empty title, so the item is dropped.
+    assert result.records == []
+    assert result.failed_records == 1
+
+
+def test_pub_date_accepts_rfc2822_and_iso_stamps() -> None:
+    expected = datetime(2026, 3, 1, 20, 0, tzinfo=timezone.utc)
+
+    assert GoogleTrendsConnector._parse_pub_date("Sun, 1 Mar 2026 12:00:00 -0800") == expected  # noqa: SLF001
+    assert GoogleTrendsConnector._parse_pub_date("2026-03-01T20:00:00Z") == expected  # noqa: SLF001
+    assert GoogleTrendsConnector._parse_pub_date("2026-03-01T20:00:00") == expected  # noqa: SLF001
+    assert GoogleTrendsConnector._parse_pub_date("yesterday") is None  # noqa: SLF001
+
+
+def test_iso_pub_date_with_zulu_parses_without_native_support(monkeypatch) -> None:
+    class _Py310Datetime(datetime):
+        @classmethod
+        def fromisoformat(cls, date_string: str) -> datetime:
+            if date_string.endswith("Z"):
+                raise ValueError(f"Invalid isoformat string: {date_string!r}")
+            return datetime.fromisoformat(date_string)
+
+    monkeypatch.setattr(connector_base, "datetime", _Py310Datetime)
+
+    parsed = GoogleTrendsConnector._parse_pub_date("2026-03-01T20:00:00Z")  # noqa: SLF001
+
+    assert parsed == datetime(2026, 3, 1, 20, 0, tzinfo=timezone.utc)
+
+
+def test_parse_traffic_labels() -> None:
+    parse = google_trends_connector._parse_traffic  # noqa: SLF001
+
+    assert parse("200K+") == 200_000
+    assert parse("1,000+") == 1_000
+    assert parse("2m") == 2_000_000
+    assert parse(" 1.5 K ") == 1_500
+    assert parse("") is None
+    assert parse("lots") is None
+    assert parse("1.2.3K") is None
+
+
+def test_stops_reading_after_max_items_and_keeps_items_before_an_error() -> None:
+    item = b"<item><title>ok</title><pubDate>Sun, 1 Mar 2026 12:00:00 GMT</pubDate></item>"
+    truncated = b"<rss><channel>" + item + b"<item><title>cut off"
+
+    capped = _fetch(truncated, max_items=1)
+    assert [record.entity_name for record in capped.records] == ["ok"]
+    assert capped.failed_records == 0
+
+    uncapped = _fetch(truncated, max_items=5)
+    assert [record.entity_name for record in uncapped.records] == ["ok"]
+    assert uncapped.failed_records == 1
+
+
+def test_traffic_is_read_from_the_retired_daily_feed_namespace_too() -> None:
+    legacy = _FEED.replace(
+        b"https://trends.google.com/trending/rss",
+        b"https://trends.google.com/trends/trendingsearches/daily",
+    )
+
+    assert _fetch(legacy).records[0].metric_value == 200_000
+
+
+def test_unchanged_feed_is_revalidated_and_reuses_the_previous_result() -> None:
+    seen_validators: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=_FEED, headers={"ETag": '"v1"'})
+
+    connector = GoogleTrendsConnector(
+        settings=GoogleTrendsSettings(max_items=2),
+        http_settings=ExternalHTTPSettings(
+            timeout_seconds=1.0,
+            max_retries=0,
+            backoff_initial_seconds=0.0,
+            backoff_multiplier=1.0,
+            rate_limit_per_second=0.0,
+        ),
+    )
+
+    async def _run() -> tuple[ConnectorFetchResult, ConnectorFetchResult]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            connector._client = client  # noqa: SLF001
+            return await connector.fetch_records_async(), await connector.fetch_records_async()
+
+    first, second = asyncio.run(_run())
+
+    assert seen_validators == [None, '"v1"']
+    assert second is first
+    assert [record.entity_name for record in second.records] == ["solar eclipse"]
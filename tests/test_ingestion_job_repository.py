@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from db.repositories.ingestion_job_repository import IngestionJobRepository
+
+
+class _CapturingSession:
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        return self
+
+    def all(self) -> list:
+        return []
+
+
+def _compiled_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_list_jobs_uses_keyset_cursor_instead_of_offset() -> None:
+    session = _CapturingSession()
+    IngestionJobRepository(session).list_jobs(  # type: ignore[arg-type]
+        limit=50,
+        status="failed",
+        before_created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        before_id=uuid.uuid4(),
+    )
+
+    sql = _compiled_sql(session.statements[0])
+    assert "(ingestion_jobs.created_at, ingestion_jobs.id) < (" in sql
+    assert "ORDER BY ingestion_jobs.created_at DESC, ingestion_jobs.id DESC" in sql
+    assert "OFFSET" not in sql
+
+
+def test_list_jobs_without_cursor_has_no_keyset_predicate() -> None:
+    session = _CapturingSession()
+    IngestionJobRepository(session).list_jobs(limit=10)  # type: ignore[arg-type]
+
+    sql = _compiled_sql(session.statements[0])
+    assert "ingestion_jobs.id) <" not in sql
+
+
+def test_list_jobs_skips_payload_columns_unless_requested() -> None:
+    session = _CapturingSession()
+    repository = IngestionJobRepository(session)  # type: ignore[arg-type]
+    repository.list_jobs(limit=10)
+    repository.list_jobs(limit=10, include_payload=True)
+
+    lean_sql, full_sql = (_compiled_sql(stmt) for stmt in session.statements)
+    assert "request_payload" not in lean_sql
+    assert "result_payload" not in lean_sql
+    assert "ingestion_jobs.request_payload" in full_sql
+    assert "ingestion_jobs.result_payload" in full_sql
+
+
+class _AggregateSession:
+    def __init__(self, row: tuple) -> None:
+        self.statements: list = []
+        self._row = row
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return self
+
+    def one(self) -> tuple:
+        return self._row
+
+
+def test_list_fingerprint_aggregates_over_the_list_filters() -> None:
+    stamp = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    session = _AggregateSession((stamp, 7))
+    fingerprint = IngestionJobRepository(session).list_fingerprint(  # type: ignore[arg-type]
+        status="failed",
+        before_created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        before_id=uuid.uuid4(),
+    )
+
+    sql = _compiled_sql(session.statements[0])
+    assert fingerprint == (stamp, 7)
+    assert "max(ingestion_jobs.updated_at)" in sql
+    assert "count(*)" in sql
+    assert "ingestion_jobs.status =" in sql
+    assert "(ingestion_jobs.created_at, ingestion_jobs.id) < (" in sql
+    assert "ORDER BY" not in sql
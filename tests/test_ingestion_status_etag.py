@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routers import ingestion_orchestrator
+from app.services.ingestion_orchestrator_service import get_ingestion_orchestrator_service
+from db.async_session import get_async_db
+
+_STAMP = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class _FakeOrchestrator:
+    def __init__(self) -> None:
+        self.fingerprint = (_STAMP, 1)
+        self.list_calls = 0
+
+    async def job_list_fingerprint_async(self, *, db, **_filters):
+        return self.fingerprint
+
+    async def list_job_statuses_async(self, *, db, **_filters):
+        self.list_calls += 1
+        return [
+            SimpleNamespace(
+                id=uuid.uuid4(),
+                job_type="api",
+                status="succeeded",
+                created_at=_STAMP,
+                updated_at=_STAMP,
+                started_at=None,
+                completed_at=None,
+                error_message=None,
+            )
+        ]
+
+
+def _client(orchestrator: _FakeOrchestrator) -> TestClient:
+    app = FastAPI()
+    app.include_router(ingestion_orchestrator.router)
+
+    async def _fake_db():
+        yield object()
+
+    app.dependency_overrides[get_async_db] = _fake_db
+    app.dependency_overrides[get_ingestion_orchestrator_service] = lambda: orchestrator
+    return TestClient(app)
+
+
+def test_listing_returns_304_while_fingerprint_is_unchanged() -> None:
+    orchestrator = _FakeOrchestrator()
+    client = _client(orchestrator)
+
+    first = client.get("/ingestion-status")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag == f'W/"{_STAMP.isoformat()}:1:100:0"'
+
+    revalidated = client.get("/ingestion-status", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert orchestrator.list_calls == 1
+
+
+def test_listing_refetches_after_a_job_changes() -> None:
+    orchestrator = _FakeOrchestrator()
+    client = _client(orchestrator)
+    etag = client.get("/ingestion-status").headers["ETag"]
+
+    orchestrator.fingerprint = (_STAMP, 2)
+    response = client.get("/ingestion-status", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert orchestrator.list_calls == 2
+
+
+def test_listing_etag_differs_per_limit_and_payload_flag() -> None:
+    orchestrator = _FakeOrchestrator()
+    client = _client(orchestrator)
+    etag = client.get("/ingestion-status").headers["ETag"]
+
+    for params in ({"limit": 10}, {"include_payload": "true"}):
+        response = client.get("/ingestion-status", params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    assert orchestrator.list_calls == 3
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import io
+import tempfile
+
+from app.services import ingestion_orchestrator_service as orchestrator_module
+
+
+def test_copy_upload_from_rolled_spool_uses_kernel_copy() -> None:
+    payload = b"entity,value\n" + b"acme,1\n" * 50_000
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(payload)
+    spool.seek(0)
+    assert spool._rolled  # noqa: SLF001
+
+    with tempfile.TemporaryFile() as dst:
+        copied = orchestrator_module._copy_upload(spool, dst)  # noqa: SLF001
+        dst.seek(0)
+        assert copied == len(payload)
+        assert dst.read() == payload
+
+
+def test_copy_upload_from_in_memory_stream_falls_back_to_copyfileobj() -> None:
+    payload = b"entity,value\nacme,1\n"
+    with tempfile.TemporaryFile() as dst:
+        copied = orchestrator_module._copy_upload(io.BytesIO(payload), dst)  # noqa: SLF001
+        dst.seek(0)
+        assert copied == len(payload)
+        assert dst.read() == payload
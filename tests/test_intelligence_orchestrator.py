@@ -167,7 +167,7 @@ class _FakeConnectorResult:
 class _MockNewsConnector:
     source = "news_api"
 
-    def fetch_records(self) -> _FakeConnectorResult:
+    async def fetch_records_async(self) -> _FakeConnectorResult:
         return _FakeConnectorResult(
             source="news_api",
             records=[
@@ -182,7 +182,7 @@ class _MockNewsConnector:
 class _MockTrendsConnector:
     source = "google_trends"
 
-    def fetch_records(self) -> _FakeConnectorResult:
+    async def fetch_records_async(self) -> _FakeConnectorResult:
         return _FakeConnectorResult(
             source="google_trends",
             records=[
@@ -195,7 +195,7 @@ class _MockTrendsConnector:
 class _FailingNewsConnector:
     source = "news_api"
 
-    def fetch_records(self):
+    async def fetch_records_async(self):
         raise ConnectionError("News API unreachable")
 
 
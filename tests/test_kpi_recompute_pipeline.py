@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.security.dependencies import require_security_context
+from app.security.models import SecurityContext
+from app.services.ingestion_orchestrator_service import get_ingestion_orchestrator_service
+from app.services.kpi_recompute_pipeline import KPIRecomputePipeline
+from db.async_session import get_async_db
+
+kpi_router = importlib.import_module("app.api.routers.kpi_router")
+
+
+class _FakeOrchestrator:
+    def __init__(self, events: list[str] | None = None) -> None:
+        self.submitted: list[dict] = []
+        self._events = events if events is not None else []
+
+    async def trigger_kpi_recompute_async(self, *, db, executor, **kwargs):
+        self.submitted.append(kwargs)
+        executor.submit(self._events.append, "job ran")
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            job_type="kpi_recompute",
+            status="pending",
+            created_at=datetime.now(timezone.utc),
+        )
+
+
+def _build_app(orchestrator: _FakeOrchestrator, events: list[str] | None = None) -> FastAPI:
+    app = FastAPI()
+    app.include_router(kpi_router.router)
+
+    async def _fake_db():
+        try:
+            yield object()
+        finally:
+            if events is not None:
+                events.append("session closed")
+
+    app.dependency_overrides[get_async_db] = _fake_db
+    app.dependency_overrides[get_ingestion_orchestrator_service] = lambda: orchestrator
+    app.dependency_overrides[require_security_context] = lambda: SecurityContext(
+        request_id="req-1",
+        tenant_id="tenant-a",
+        subject="tester",
+        auth_type="api_key",
+    )
+    return app
+
+
+def test_recompute_endpoint_queues_job_and_returns_202() -> None:
+    orchestrator = _FakeOrchestrator()
+    client = TestClient(_build_app(orchestrator))
+    response = client.post(
+        "/recompute-kpis",
+        json={"entity_name": "acme", "business_type": "saas", "include_segmentation": True},
+    )
+
+    assert response.status_code == 202
+    assert response.json()["job_type"] == "kpi_recompute"
+    assert "job_id" in response.json()
+    assert orchestrator.submitted == [
+        {"entity_name": "acme", "business_type": "saas", "include_segmentation": True}
+    ]
+
+
+def test_recompute_closes_request_session_before_background_job_runs() -> None:
+    events: list[str] = []
+    client = TestClient(_build_app(_FakeOrchestrator(events), events))
+    response = client.post(
+        "/recompute-kpis",
+        json={"entity_name": "acme", "business_type": "saas"},
+    )
+
+    assert response.status_code == 202
+    assert events == ["session closed", "job ran"]
+
+
+def test_recompute_rejects_unknown_business_type_before_queueing() -> None:
+    orchestrator = _FakeOrchestrator()
+    client = TestClient(_build_app(orchestrator))
+    response = client.post(
+        "/recompute-kpis",
+        json={"entity_name": "acme", "business_type": "not-a-type"},
+    )
+
+    assert response.status_code == 400
+    assert orchestrator.submitted == []
+
+
+def test_router_import_does_not_load_analytics_orchestrators() -> None:
+    # Fresh interpreter: this test session has already imported the pipeline.
+    probe = (
+        "import sys, app.api.routers.kpi_router\n"
+        "heavy = ['app.services.kpi_recompute_pipeline', 'app.services.kpi_orchestrator',\n"
+        "         'forecast.orchestrator', 'risk.orchestrator', 'segmentation.orchestrator']\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == ""
+
+
+def test_pipeline_runs_segmentation_alongside_forecast_risk_chain(monkeypatch) -> None:
+    # Both branches wait on a barrier: the run would deadlock (and the
+    # barrier time out) if they were still dispatched one after the other.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _chain(**_kwargs):
+        barrier.wait()
+        return {"points": 3}, None, ["risk: boom"]
+
+    def _segmentation(**_kwargs):
+        barrier.wait()
+        return {"n_clusters": 1}, []
+
+    pipeline = KPIRecomputePipeline(session_factory=lambda: None)
+    monkeypatch.setattr(pipeline, "_run_kpi_windows", lambda **_kwargs: [])
+    monkeypatch.setattr(pipeline, "_run_forecast_then_risk", _chain)
+    monkeypatch.setattr(pipeline, "_run_segmentation", _segmentation)
+
+    payload = pipeline.run(
+        db=object(),
+        entity_name="acme",
+        business_type="saas",
+        include_segmentation=True,
+    )
+
+    assert payload["forecast"] == {"points": 3}
+    assert payload["risk"] is None
+    assert payload["segmentation"] == {"n_clusters": 1}
+    assert payload["pipeline_errors"] == ["risk: boom"]
+
+
+def test_pipeline_reports_crashed_branch_without_dropping_the_other(monkeypatch) -> None:
+    def _segmentation(**_kwargs):
+        raise RuntimeError("pool exhausted")
+
+    pipeline = KPIRecomputePipeline(session_factory=lambda: None)
+    monkeypatch.setattr(pipeline, "_run_kpi_windows", lambda **_kwargs: [])
+    monkeypatch.setattr(
+        pipeline,
+        "_run_forecast_then_risk",
+        lambda **_kwargs: ({"points": 1}, {"score": 10}, []),
+    )
+    monkeypatch.setattr(pipeline, "_run_segmentation", _segmentation)
+
+    payload = pipeline.run(
+        db=object(),
+        entity_name="acme",
+        business_type="saas",
+        include_segmentation=True,
+    )
+
+    assert payload["risk"] == {"score": 10}
+    assert payload["segmentation"] is None
+    assert payload["pipeline_errors"] == ["segmentation: pool exhausted"]
+
+
+def test_segmentation_short_circuits_without_numeric_metrics(monkeypatch) -> None:
+    pipeline_module = importlib.import_module("app.services.kpi_recompute_pipeline")
+
+    def _unexpected(_kpi_result):
+        raise AssertionError("records must not be built when none would qualify")
+
+    monkeypatch.setattr(pipeline_module, "_build_segmentation_records", _unexpected)
+    kpi_result = SimpleNamespace(metrics={"mrr": {"value": None}, "note": {"value": "n/a"}})
+
+    pipeline = KPIRecomputePipeline(session_factory=lambda: None)
+    summary, errors = pipeline._run_segmentation(  # noqa: SLF001
+        entity_name="acme",
+        kpi_result=kpi_result,
+    )
+
+    assert summary is None
+    assert errors == ["segmentation: insufficient records for clustering"]
+    assert pipeline_module._segmentation_record_count(  # noqa: SLF001
+        SimpleNamespace(metrics={"mrr": {"value": 12.5}})
+    ) == 1
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.scheduler import jobs
+from forecast.repository import ForecastRepository
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def sessions(monkeypatch) -> list[_FakeSession]:
+    opened: list[_FakeSession] = []
+
+    @contextmanager
+    def _scope():
+        session = _FakeSession()
+        opened.append(session)
+        try:
+            yield session
+        finally:
+            session.closed = True
+
+    monkeypatch.setattr(jobs, "_session_scope", _scope)
+    monkeypatch.setattr(
+        jobs,
+        "_resolve_entities",
+        lambda _db: [("acme", "saas"), ("globex", "ecommerce")],
+    )
+    monkeypatch.setenv("SCHEDULER_MAX_WORKERS", "2")
+    return opened
+
+
+def test_daily_kpi_runs_entities_concurrently_on_separate_sessions(monkeypatch, sessions) -> None:
+    # Both entities wait on a barrier: a sequential loop would time out.
+    barrier = threading.Barrier(2, timeout=5)
+    seen: list[tuple[str, object]] = []
+
+    class _Orchestrator:
+        def run(self, *, entity_name, db, **_kwargs):
+            if entity_name not in {name for name, _ in seen}:
+                barrier.wait()  # first window of each entity
+            seen.append((entity_name, db))
+
+    monkeypatch.setattr(jobs, "get_kpi_orchestrator", lambda: _Orchestrator())
+
+    response = jobs.run_daily_kpi()
+
+    assert response.pipeline_status == "success"
+    assert {name for name, _ in seen} == {"acme", "globex"}
+    sessions_by_entity = {name: {id(db) for n, db in seen if n == name} for name, _ in seen}
+    assert sessions_by_entity["acme"].isdisjoint(sessions_by_entity["globex"])
+    assert all(session.closed for session in sessions)
+
+
+def test_daily_risk_reports_failure_after_every_entity_ran(monkeypatch, sessions) -> None:
+    attempted: list[str] = []
+
+    def _risk_one(entity_name: str, _business_type: str, **_prefetched) -> None:
+        attempted.append(entity_name)
+        if entity_name == "acme":
+            raise ValueError("no KPI data")
+
+    monkeypatch.setattr(jobs, "_risk_one", _risk_one)
+    monkeypatch.setattr(jobs, "_prefetch_risk_inputs", lambda _db, _entities: {})
+
+    response = jobs.run_daily_risk()
+
+    assert response.pipeline_status == "failed"
+    assert sorted(attempted) == ["acme", "globex"]
+
+
+def test_daily_pipeline_feeds_kpi_and_forecast_results_into_risk(monkeypatch, sessions) -> None:
+    kpi_runs: list[str] = []
+    risk_inputs: dict[str, tuple[dict, dict]] = {}
+
+    class _KPIOrchestrator:
+        def run(self, *, entity_name, **_kwargs):
+            kpi_runs.append(entity_name)
+            return SimpleNamespace(metrics={"mrr": {"value": 10.0}, "growth_rate": {"value": 0.2}})
+
+    class _ForecastOrchestrator:
+        def __init__(self, _db) -> None:
+            pass
+
+        def generate_forecast(self, *, entity_name, metric_name, values):
+            return {"entity": entity_name, "points": len(values), "slope": 1.0}
+
+    class _RiskOrchestrator:
+        def __init__(self, _db) -> None:
+            pass
+
+        def generate_risk_score(self, *, entity_name, kpi_data, forecast_data):
+            risk_inputs[entity_name] = (kpi_data, forecast_data)
+            return {"risk_score": 10, "risk_level": "low"}
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("the pipeline must not re-read stored KPI/forecast rows")
+
+    monkeypatch.setattr(jobs, "get_kpi_orchestrator", lambda: _KPIOrchestrator())
+    monkeypatch.setattr(jobs, "ForecastOrchestrator", _ForecastOrchestrator)
+    monkeypatch.setattr(jobs, "RiskOrchestrator", _RiskOrchestrator)
+    monkeypatch.setattr(jobs, "_latest_kpi_metrics", _unexpected)
+    monkeypatch.setattr(jobs, "_latest_forecast_data", _unexpected)
+
+    response = jobs.run_daily_pipeline()
+
+    assert response.pipeline_status == "success"
+    windows = len(jobs._recompute_windows())  # noqa: SLF001
+    assert sorted(kpi_runs) == ["acme"] * windows + ["globex"] * windows
+    kpi_data, forecast_data = risk_inputs["acme"]
+    assert kpi_data["revenue_growth_delta"] == 0.2
+    assert forecast_data == {"entity": "acme", "points": windows, "slope": 1.0}
+
+
+def test_build_scheduler_registers_only_the_fused_daily_job() -> None:
+    scheduler = jobs.build_scheduler()
+
+    assert [job.id for job in scheduler.get_jobs()] == ["daily_pipeline"]
+
+
+def test_scheduled_jobs_coalesce_missed_runs_and_never_overlap() -> None:
+    (job,) = jobs.build_scheduler().get_jobs()
+
+    assert job.coalesce is True
+    assert job.max_instances == 1
+
+
+def test_daily_risk_uses_prefetched_rows_instead_of_per_entity_queries(monkeypatch, sessions) -> None:
+    scored: dict[str, tuple[dict, dict]] = {}
+
+    class _RiskOrchestrator:
+        def __init__(self, _db) -> None:
+            pass
+
+        def generate_risk_score(self, *, entity_name, kpi_data, forecast_data):
+            scored[entity_name] = (kpi_data, forecast_data)
+            return {"risk_score": 1, "risk_level": "low"}
+
+    def _unexpected(*_args, **_kwargs):
+        raise AssertionError("prefetched entities must not be looked up one by one")
+
+    def _prefetch(_db, entities):
+        return {
+            "latest_kpis": {name: {"growth_rate": {"value": 0.5}} for name, _ in entities},
+            "latest_forecasts": {
+                (name, jobs.primary_metric_for_business_type(btype)): {"slope": 2.0}
+                for name, btype in entities
+            },
+        }
+
+    monkeypatch.setattr(jobs, "RiskOrchestrator", _RiskOrchestrator)
+    monkeypatch.setattr(jobs, "_prefetch_risk_inputs", _prefetch)
+    monkeypatch.setattr(jobs, "_latest_kpi_metrics", _unexpected)
+    monkeypatch.setattr(jobs, "_latest_forecast_data", _unexpected)
+
+    response = jobs.run_daily_risk()
+
+    assert response.pipeline_status == "success"
+    assert scored["globex"][0]["revenue_growth_delta"] == 0.5
+    assert scored["globex"][1] == {"slope": 2.0}
+
+
+def test_bulk_forecast_lookup_uses_one_distinct_on_query() -> None:
+    class _CapturingSession:
+        def __init__(self) -> None:
+            self.statements: list = []
+
+        def scalars(self, stmt):
+            self.statements.append(stmt)
+            return []
+
+    session = _CapturingSession()
+    ForecastRepository(session).get_latest_forecasts_bulk(  # type: ignore[arg-type]
+        [("acme", "mrr"), ("globex", "gmv"), ("acme", "mrr")]
+    )
+
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "DISTINCT ON (forecast_metric.entity_name, forecast_metric.metric_name)" in sql
+    assert "ORDER BY forecast_metric.entity_name, forecast_metric.metric_name, " in sql
+
+
+def test_risk_prefetch_extracts_kpi_values_in_sql() -> None:
+    class _Session:
+        def __init__(self) -> None:
+            self.executed: list = []
+
+        def execute(self, stmt):
+            self.executed.append(stmt)
+            # One row: every extracted value is the JSON text "0.25".
+            return [("acme", *["0.25"] * (len(stmt.selected_columns) - 1))]
+
+        def scalars(self, _stmt):
+            return []
+
+    session = _Session()
+    prefetched = jobs._prefetch_risk_inputs(session, [("acme", "saas")])  # noqa: SLF001
+
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "DISTINCT ON (computed_kpis.entity_name)" in sql
+    assert "#>>" in sql
+    assert "computed_kpis.computed_kpis," not in sql
+    kpis = prefetched["latest_kpis"]["acme"]
+    assert kpis["growth_rate"] == {"value": "0.25"}
+    assert jobs.churn_metric_for_business_type("saas") in kpis
+
+
+def test_env_entities_are_parsed_once_per_setting(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("SCHEDULER_ENTITIES", "acme:SaaS, bad-token ,globex:ecommerce")
+
+    with caplog.at_level("WARNING", logger=jobs.__name__):
+        first = jobs._entities_from_env()  # noqa: SLF001
+        second = jobs._entities_from_env()  # noqa: SLF001
+
+    assert first == second == [("acme", "saas"), ("globex", "ecommerce")]
+    assert len([r for r in caplog.records if "malformed" in r.getMessage()]) == 1
+
+    monkeypatch.setenv("SCHEDULER_ENTITIES", "initech:agency")
+    assert jobs._entities_from_env() == [("initech", "agency")]  # noqa: SLF001
+
+
+def test_db_entity_discovery_projects_only_the_business_type_key() -> None:
+    class _Session:
+        def __init__(self) -> None:
+            self.executed: list = []
+
+        def execute(self, stmt):
+            self.executed.append(stmt)
+            return [("acme", "saas")]
+
+    session = _Session()
+    entities = jobs._entities_from_db(session)  # noqa: SLF001
+
+    assert entities == [("acme", "saas")]
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "clients.config ->>" in sql
+    assert "clients.config," not in sql
+    assert session.executed[0].get_execution_options()["yield_per"] == 500
+
+
+def test_latest_kpi_lookup_fetches_only_the_jsonb_column() -> None:
+    class _Session:
+        def __init__(self, rows: list) -> None:
+            self.rows = rows
+            self.executed: list = []
+
+        def execute(self, stmt, params):
+            self.executed.append((stmt, params))
+            return SimpleNamespace(first=lambda: self.rows[0] if self.rows else None)
+
+    session = _Session([SimpleNamespace(computed_kpis={"mrr": {"value": 1.0}})])
+    assert jobs._latest_kpi_metrics(session, "acme") == {"mrr": {"value": 1.0}}  # noqa: SLF001
+
+    stmt, params = session.executed[0]
+    assert params == {"entity_name": "acme"}
+    assert [column.name for column in stmt.selected_columns] == ["computed_kpis"]
+
+    with pytest.raises(ValueError, match="No KPI data"):
+        jobs._latest_kpi_metrics(_Session([]), "acme")  # noqa: SLF001
+
+
+def test_resolve_entities_skips_env_overridden_clients_in_sql(monkeypatch) -> None:
+    class _Session:
+        def __init__(self) -> None:
+            self.executed: list = []
+
+        def execute(self, stmt):
+            self.executed.append(stmt)
+            return [("initech", "agency")]
+
+    monkeypatch.setenv("SCHEDULER_ENTITIES", "acme:saas,acme:ecommerce")
+    session = _Session()
+
+    assert jobs._resolve_entities(session) == [  # noqa: SLF001
+        ("initech", "agency"),
+        ("acme", "ecommerce"),
+    ]
+    sql = str(session.executed[0].compile(dialect=postgresql.dialect()))
+    assert "clients.name NOT IN" in sql
+
+
+def test_stage_logs_one_info_summary_for_all_entities(monkeypatch, sessions, caplog) -> None:
+    def _risk_one(entity_name: str, _business_type: str, **_prefetched) -> None:
+        if entity_name == "globex":
+            raise ValueError("no KPI data")
+
+    monkeypatch.setattr(jobs, "_risk_one", _risk_one)
+    monkeypatch.setattr(jobs, "_prefetch_risk_inputs", lambda _db, _entities: {})
+
+    with caplog.at_level("INFO", logger=jobs.__name__):
+        jobs.run_daily_risk()
+
+    summaries = [r.getMessage() for r in caplog.records if "complete" in r.getMessage()]
+    assert summaries == ["Scheduler: daily_risk complete entities=2 failed=1"]
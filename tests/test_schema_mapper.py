@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import unittest
 
+from app.mappers.canonical_mapper import normalize_header
 from app.mappers.schema_mapper import SchemaMapper
 from app.validators.csv_validator import CSVRowValidator
 from app.validators.mapping_validator import SchemaMappingError
@@ -33,6 +34,68 @@ class TestSchemaMapper(unittest.TestCase):
         self.assertEqual(resolution.canonical_to_source["metric_value"], "Metric Amnt")
         self.assertEqual(resolution.canonical_to_source["timestamp"], "Recorded At")
 
+    def test_parallel_fuzzy_scoring_matches_single_worker(self) -> None:
+        headers = [
+            "Source Typ",
+            "Competitor Nmae",
+            "Insight Catgory",
+            "KPI",
+            "Metric Amnt",
+            "Recorded At",
+        ]
+
+        parallel = SchemaMapper(fuzzy_workers=-1).resolve_mapping(headers)
+
+        self.assertEqual(
+            parallel.canonical_to_source,
+            self.mapper.resolve_mapping(headers).canonical_to_source,
+        )
+
+    def test_exact_headers_skip_fuzzy_scoring(self) -> None:
+        headers = [
+            "source_type",
+            "entity_name",
+            "category",
+            "role",
+            "metric_name",
+            "metric_value",
+            "timestamp",
+            "region",
+            "metadata_json",
+        ]
+
+        def _unexpected(**_kwargs):
+            raise AssertionError("fuzzy scoring must not run when every field matches exactly")
+
+        self.mapper._fuzzy_header_scores = _unexpected  # noqa: SLF001
+        resolution = self.mapper.resolve_mapping(headers)
+
+        self.assertEqual(resolution.canonical_to_source["metric_value"], "metric_value")
+        self.assertEqual(set(resolution.match_strategies.values()), {"exact_or_alias"})
+
+    def test_repeated_headers_reuse_cached_resolution(self) -> None:
+        headers = [
+            "Source Typ",
+            "Competitor Nmae",
+            "Insight Catgory",
+            "KPI",
+            "Metric Amnt",
+            "Recorded At",
+        ]
+        first = self.mapper.resolve_mapping(headers)
+        first.canonical_to_source["metric_name"] = "mutated"
+
+        def _unexpected(**_kwargs):
+            raise AssertionError("identical headers must reuse the cached resolution")
+
+        self.mapper._resolve_fields = _unexpected  # noqa: SLF001
+        second = self.mapper.resolve_mapping(headers)
+
+        self.assertEqual(second.canonical_to_source["metric_name"], "KPI")
+        self.assertEqual(second.match_strategies["entity_name"], "fuzzy")
+        with self.assertRaises(AssertionError):
+            self.mapper.resolve_mapping(headers, manual_overrides={"metric_name": "KPI"})
+
     def test_manual_override_mapping_takes_precedence(self) -> None:
         headers = ["src", "biz", "cat", "label", "amt", "when"]
         manual = {
@@ -143,6 +206,11 @@ class TestSchemaMapper(unittest.TestCase):
         self.assertEqual(record.category, "pricing")
         self.assertEqual(record.metric_value, 99.5)
 
+    def test_normalize_header_strips_punctuation_and_keeps_unicode_alnum(self) -> None:
+        self.assertEqual(normalize_header("  Metric_Value (USD) "), "metricvalueusd")
+        self.assertEqual(normalize_header("Région-Name²"), "régionname²")
+        self.assertEqual(normalize_header("--"), "")
+
 
 if __name__ == "__main__":
     unittest.main()